@@ -1,231 +1,228 @@
 import requests
-import cloudscraper
-from bs4 import BeautifulSoup
-from newspaper import Article
+import os
 import time
-from urllib.parse import urlparse
+from collections import namedtuple
+from cache import DiskCache
+from http_session import sessions
+from strategy_stats import StrategyStats
+from dedupe import normalize_url
+from streaming_extract import StreamingExtractor
+from html_extract import clean_text
+from extraction_pool import extraction_pool
+from politeness import host_scheduler, retry_after_header
+from metrics import metrics, log
+from config import (
+    CACHE_DIR, ARTICLE_CACHE_ENABLED, ARTICLE_CACHE_TTL_HOURS, ARTICLE_CACHE_MAX_MB,
+    ADAPTIVE_STRATEGIES, STRATEGY_SKIP_MIN_ATTEMPTS, STRATEGY_SKIP_MAX_RATE,
+    MAX_HTML_BYTES, STREAMING_EXTRACTION, STREAM_TARGET_CHARS,
+)
 
-def fetch_with_newspaper(url: str) -> str:
-    """Strategy 1: Use newspaper3k with custom headers"""
-    try:
-        article = Article(url)
-        article.config.browser_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        article.config.request_timeout = 15
-        
-        article.download()
-        article.parse()
-        
-        if article.text and len(article.text.strip()) > 100:
-            return article.text
-    except Exception as e:
-        pass  # Silent fail, will try next strategy
-    
-    return ""
+# Extracted article text from earlier runs, keyed by normalized URL
+article_cache = DiskCache(
+    os.path.join(CACHE_DIR, "articles.sqlite"),
+    ttl_seconds=ARTICLE_CACHE_TTL_HOURS * 3600,
+    max_bytes=ARTICLE_CACHE_MAX_MB * 1024 * 1024,
+) if ARTICLE_CACHE_ENABLED else None
 
-def fetch_with_cloudscraper(url: str) -> str:
-    """Strategy 2: Use cloudscraper for Cloudflare-protected sites"""
-    try:
-        scraper = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'mobile': False
-            }
-        )
-        
-        response = scraper.get(url, timeout=15)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'lxml')
-        
-        # Remove unwanted elements
-        for element in soup.find_all(['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'noscript']):
-            element.decompose()
-        
-        text = extract_article_text(soup, url)
-        
-        if text and len(text.strip()) > 100:
-            return text
-            
-    except Exception as e:
-        pass  # Silent fail
-    
-    return ""
+# Per-domain strategy outcomes from earlier runs, used to order strategies
+strategy_stats = StrategyStats(
+    os.path.join(CACHE_DIR, "strategy_stats.json"),
+    skip_min_attempts=STRATEGY_SKIP_MIN_ATTEMPTS,
+    skip_max_rate=STRATEGY_SKIP_MAX_RATE,
+)
+
+# HTTP statuses that mean "this client was refused", worth retrying with another strategy
+BLOCKING_STATUSES = {401, 403, 407, 429, 503}
+
+# Markers of bot-challenge / interstitial pages served with a 200 status
+BLOCK_PAGE_MARKERS = (
+    b"cf-browser-verification", b"cf-challenge", b"challenge-platform",
+    b"just a moment...", b"attention required!", b"captcha",
+)
+
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+    'Referer': 'https://www.google.com/'
+}
+
+
+class BlockedError(Exception):
+    """The site refused this client (status code or challenge page); another strategy may get through"""
+
+    def __init__(self, message: str, status: int = None, retry_after: float = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+# A downloaded page: raw (possibly truncated) HTML, article text when streaming extraction got enough,
+# and the charset the server declared (None when it declared none)
+Page = namedtuple("Page", ["html", "text", "encoding"])
 
-def fetch_with_requests(url: str) -> str:
-    """Strategy 3: Use standard requests with comprehensive headers"""
+
+def read_response(response) -> Page:
+    """
+    Read a streamed response body, raising BlockedError for refusals and HTTPError for other failures.
+    At most MAX_HTML_BYTES are read. In streaming mode chunks are also fed to a StreamingExtractor
+    and reading stops as soon as it has collected STREAM_TARGET_CHARS of article text.
+    """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-            'Referer': 'https://www.google.com/'
-        }
-        
-        session = requests.Session()
-        response = session.get(url, headers=headers, timeout=10, allow_redirects=True)
+        if response.status_code in BLOCKING_STATUSES:
+            raise BlockedError(f"HTTP {response.status_code}", response.status_code, retry_after_header(response))
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'lxml')
-        
-        # Remove unwanted elements
-        for element in soup.find_all(['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'noscript']):
-            element.decompose()
-        
-        text = extract_article_text(soup, url)
-        
-        if text and len(text.strip()) > 100:
-            return text
-            
-    except Exception as e:
-        pass  # Silent fail
-    
-    return ""
 
-def extract_article_text(soup: BeautifulSoup, url: str) -> str:
-    """Extract text using multiple strategies"""
-    
-    domain = urlparse(url).netloc.lower()
-    
-    # Site-specific selectors
-    selectors_map = {
-        'msn.com': [
-            'article',
-            'div[class*="article"]',
-            'div[class*="story"]',
-            'div[class*="content"]',
-            'main article',
-            'main div[class*="article"]',
-            '[data-t="article-body"]',
-            '.article-body',
-            '.articlebody',
-            'main .content',
-            'div[role="main"]',
-            'div[id*="article"]',
-            'div[id*="content"]',
-        ],
-        'abc.net.au': [
-            'article div[data-component="ArticleBody"]',
-            'article .article-content',
-            'article #body',
-            '.article__body',
-            'div[data-component="BodyText"]'
-        ],
-        'smh.com.au': ['article .article-body', '#article-body', 'article'],
-        'theage.com.au': ['article .article-body', 'article'],
-        'afr.com': ['article .article-content', 'article'],
-        'news.com.au': ['.story-primary', '.story-block', 'article'],
-        'theguardian.com': ['.article-body-commercial-selector', 'article'],
-        'bbc.com': ['.article__body-content', 'article'],
-        'reuters.com': ['.article-body__content', 'article'],
-        '9news.com.au': ['.article__body', 'article', '.story__body'],
-        '7news.com.au': ['.article-body', 'article'],
-    }
-    
-    # Try domain-specific selectors
-    for domain_key, selectors in selectors_map.items():
-        if domain_key in domain:
-            for selector in selectors:
-                elements = soup.select(selector)
-                if elements:
-                    text = '\n\n'.join([el.get_text(strip=True, separator=' ') for el in elements])
-                    if len(text) > 200:
-                        return clean_text(text)
-    
-    # Generic strategies
-    strategies = [
-        # Strategy 1: article tag
-        lambda: soup.find_all('article'),
-        # Strategy 2: main tag
-        lambda: soup.find_all('main'),
-        # Strategy 3: Content divs
-        lambda: soup.find_all(['div', 'section'], class_=lambda x: x and any(
-            kw in str(x).lower() for kw in ['content', 'article', 'story', 'body', 'text', 'post']
-        )),
-        # Strategy 4: Role-based
-        lambda: soup.find_all(['div', 'section'], attrs={'role': 'main'}),
-    ]
-    
-    for strategy in strategies:
-        try:
-            elements = strategy()
-            if elements:
-                # Try to find the element with most paragraphs
-                best_element = None
-                max_paragraphs = 0
-                
-                for el in elements:
-                    p_count = len(el.find_all('p'))
-                    if p_count > max_paragraphs:
-                        max_paragraphs = p_count
-                        best_element = el
-                
-                if best_element and max_paragraphs >= 3:
-                    paragraphs = best_element.find_all('p')
-                    text = '\n\n'.join([p.get_text(strip=True) for p in paragraphs])
-                    if len(text) > 200:
-                        return clean_text(text)
-        except:
-            continue
-    
-    # Last resort: all paragraphs
-    paragraphs = soup.find_all('p')
-    if len(paragraphs) >= 5:
-        text = '\n\n'.join([p.get_text(strip=True) for p in paragraphs])
-        if len(text) > 200:
-            return clean_text(text)
-    
-    return ""
+        # Only trust a charset the server actually declared; otherwise the parsers sniff it
+        declared = 'charset' in response.headers.get('Content-Type', '').lower()
+        encoding = response.encoding if declared else None
+
+        extractor = None
+        if STREAMING_EXTRACTION:
+            extractor = StreamingExtractor(STREAM_TARGET_CHARS, encoding)
+
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=16 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if extractor is not None and extractor.feed(chunk):
+                break
+            if size >= MAX_HTML_BYTES:
+                break
+    finally:
+        response.close()
+
+    html = b''.join(chunks)[:MAX_HTML_BYTES]
+    metrics.count("fetch.bytes", size)
+
+    text = ""
+    if extractor is not None:
+        extractor.finish()
+        text = clean_text(extractor.text())
+        if len(text.strip()) <= 100:
+            text = ""
+
+    head = html[:20000].lower()
+    if not text and len(html) < 20000 and any(marker in head for marker in BLOCK_PAGE_MARKERS):
+        raise BlockedError("challenge page")
+    return Page(html, text, encoding)
+
+
+def download_with_cloudscraper(url: str) -> Page:
+    """Strategy 1: Use cloudscraper for Cloudflare-protected sites"""
+    response = sessions.scraper().get(url, timeout=15, stream=True)
+    return read_response(response)
+
+
+def download_with_requests(url: str) -> Page:
+    """Strategy 2: Use standard requests with comprehensive headers"""
+    response = sessions.session().get(url, headers=BROWSER_HEADERS, timeout=10, allow_redirects=True, stream=True)
+    return read_response(response)
+
+
+def download_with_newspaper(url: str) -> Page:
+    """Strategy 3: Plain request with newspaper3k's browser user agent"""
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    response = sessions.session().get(url, headers=headers, timeout=15, allow_redirects=True, stream=True)
+    return read_response(response)
 
-def clean_text(text: str) -> str:
-    """Clean up extracted text"""
-    # Remove excessive whitespace
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    text = '\n\n'.join(lines)
-    
-    # Remove very short paragraphs (likely navigation/metadata)
-    paragraphs = text.split('\n\n')
-    paragraphs = [p for p in paragraphs if len(p) > 30]
-    
-    return '\n\n'.join(paragraphs)
 
 def fetch_article_text(url: str) -> str:
     """
     Fetch article text using multiple strategies with fallbacks.
     Returns article text or empty string on complete failure.
     """
+    with metrics.timer("fetch.article"):
+        text = _fetch_article_text(url)
+    metrics.count("fetch.articles_ok" if text else "fetch.articles_failed")
+    return text
+
+
+def _fetch_article_text(url: str) -> str:
+    log(f"   🔗 URL: {url[:80]}...")
+
+    cache_key = normalize_url(url)
+    if article_cache is not None:
+        cached = article_cache.get(cache_key)
+        if cached:
+            text, meta = cached
+            metrics.count("fetch.cache_hits")
+            log(f"   💾 Cache hit ({meta.get('strategy', 'unknown')}): {len(text)} chars")
+            return text
     
-    print(f"   🔗 URL: {url[:80]}...")
-    
-    # Try different strategies in order
+    # Try different download strategies in order (best first for domains seen before).
+    # The first page that downloads is handed to every extractor; another download is only
+    # attempted when the site blocked us or the network failed, never for an extraction miss.
     strategies = [
-        ("cloudscraper", fetch_with_cloudscraper),
-        ("requests", fetch_with_requests),
-        ("newspaper3k", fetch_with_newspaper),
+        ("cloudscraper", download_with_cloudscraper),
+        ("requests", download_with_requests),
+        ("newspaper3k", download_with_newspaper),
     ]
+    if ADAPTIVE_STRATEGIES:
+        strategies = strategy_stats.order(url, strategies)
     
-    for strategy_name, strategy_func in strategies:
+    for strategy_name, download in strategies:
+        # The host scheduler paces requests per site and backs off after refusals,
+        # so the next strategy for a blocked host waits while other hosts keep going
         try:
-            print(f"   🔄 Trying {strategy_name}...")
-            text = strategy_func(url)
-            if text:
-                print(f"   ✅ SUCCESS with {strategy_name}: Fetched {len(text)} chars")
-                return text
-            else:
-                print(f"   ⚠️ {strategy_name}: No content extracted")
-                time.sleep(0.5)  # Brief delay between strategies
+            with host_scheduler.slot(url):
+                start = time.perf_counter()
+                log(f"   🔄 Trying {strategy_name}...")
+                page = download(url)
+            metrics.observe(f"fetch.download.{strategy_name}", time.perf_counter() - start)
+        except BlockedError as e:
+            metrics.count(f"fetch.blocked.{strategy_name}")
+            strategy_stats.record(url, strategy_name, False, time.perf_counter() - start)
+            host_scheduler.penalize(url, e.status, e.retry_after)
+            log(f"   ❌ {strategy_name} blocked: {str(e)[:80]}")
+            continue
+        except (requests.ConnectionError, requests.Timeout) as e:
+            metrics.count(f"fetch.network_errors.{strategy_name}")
+            strategy_stats.record(url, strategy_name, False, time.perf_counter() - start)
+            log(f"   ❌ {strategy_name} network error: {str(e)[:80]}")
+            continue
+        except requests.HTTPError as e:
+            metrics.count(f"fetch.http_errors.{strategy_name}")
+            strategy_stats.record(url, strategy_name, False, time.perf_counter() - start)
+            status = e.response.status_code if e.response is not None else None
+            if status is not None and status >= 500:
+                host_scheduler.penalize(url, status, retry_after_header(e.response))
+                log(f"   ❌ {strategy_name} server error: {str(e)[:80]}")
+                continue
+            log(f"   ❌ {strategy_name} HTTP error, not retrying: {str(e)[:80]}")
+            return ""
         except Exception as e:
-            print(f"   ❌ {strategy_name} error: {str(e)[:80]}")
-            time.sleep(0.5)
+            metrics.count(f"fetch.other_errors.{strategy_name}")
+            strategy_stats.record(url, strategy_name, False, time.perf_counter() - start)
+            log(f"   ❌ {strategy_name} error: {str(e)[:80]}")
+            continue
+
+        host_scheduler.succeed(url)
+
+        if page.text:
+            text, extractor_name = page.text, "stream"
+        else:
+            text, extractor_name = extraction_pool.extract(page.html, url, page.encoding)
+        strategy_stats.record(url, strategy_name, bool(text), time.perf_counter() - start)
+        if text:
+            metrics.count(f"fetch.wins.{strategy_name}")
+            log(f"   ✅ SUCCESS with {strategy_name} ({extractor_name}): Fetched {len(text)} chars")
+            if article_cache is not None:
+                article_cache.set(cache_key, text, {"strategy": strategy_name, "extractor": extractor_name, "url": url})
+            return text
+
+        log(f"   ⚠️ {strategy_name}: page downloaded but no content extracted, not re-downloading")
+        return ""
     
-    print(f"   ❌ All {len(strategies)} strategies failed for this URL")
+    log(f"   ❌ All {len(strategies)} strategies failed for this URL")
     return ""
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+Benchmark: linear is_duplicate() scan vs DedupeIndex.
+
+Generates synthetic news results (unique headlines, syndicated near-duplicates and
+repeated URLs), runs both dedupe paths and checks they keep exactly the same items.
+With --lsh the opt-in MinHash-LSH index is timed too, with the number of duplicates
+it kept that the exact index removed.
+
+    python benchmarks/bench_dedupe.py
+    python benchmarks/bench_dedupe.py --sizes 300 3000 30000 --linear-max 3000 --lsh
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dedupe import DedupeIndex, is_duplicate
+
+WORDS = (
+    "health digital AI hospital patients NSW Victoria Queensland telehealth funding "
+    "government clinicians startup wearable data privacy regulator trial cancer mental "
+    "care aged rural virtual GP app records system launches announces million new study "
+    "Australian national program pilot research sector rollout reform cyber breach"
+).split()
+
+
+def make_vocabulary(rng: random.Random, size: int = 5000) -> tuple:
+    """Headline vocabulary: topic words plus a long tail of names, places and organisations"""
+    tail = set()
+    while len(tail) < size:
+        tail.add("".join(rng.choice("abcdefghijklmnoprstuvwy") for _ in range(rng.randint(3, 10))))
+    words = WORDS + sorted(tail)
+    # Zipf-like weights: a handful of words appear in most headlines, most words are rare
+    weights = [1.0 / (rank + 1) for rank in range(len(words))]
+    return words, weights
+
+
+def make_results(n: int, seed: int = 42) -> list:
+    """Build n search results where ~30% are near-duplicates or repeated URLs"""
+    rng = random.Random(seed)
+    words, weights = make_vocabulary(rng)
+    results = []
+    for i in range(n):
+        roll = rng.random()
+        if results and roll < 0.15:
+            # Syndicated copy: same headline with small edits, different site
+            base = rng.choice(results)["title"]
+            chars = list(base)
+            for _ in range(rng.randint(0, 3)):
+                chars.insert(rng.randint(0, len(chars)), rng.choice("abcdefg -"))
+            results.append({"title": "".join(chars), "link": f"https://site{i}.com.au/story/{i}"})
+        elif results and roll < 0.30:
+            # Same article surfaced again with tracking params
+            base = rng.choice(results)
+            results.append({"title": base["title"] + " - News", "link": base["link"] + "?utm_source=rss"})
+        else:
+            title = " ".join(rng.choices(words, weights, k=rng.randint(6, 14))).capitalize()
+            results.append({"title": title, "link": f"https://news{i % 50}.com.au/article/{i}"})
+    return results
+
+
+def run_linear(results: list) -> list:
+    kept = []
+    for item in results:
+        if not is_duplicate(item, kept):
+            kept.append(item)
+    return kept
+
+
+def run_indexed(results: list) -> list:
+    index = DedupeIndex()
+    return [item for item in results if index.add_if_new(item)]
+
+
+def run_lsh(results: list) -> list:
+    index = DedupeIndex(lsh=True)
+    return [item for item in results if index.add_if_new(item)]
+
+
+def timed(func, results):
+    start = time.perf_counter()
+    kept = func(results)
+    return kept, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[300, 1000, 3000, 10000, 30000])
+    parser.add_argument("--linear-max", type=int, default=1000,
+                        help="skip the quadratic baseline above this many items")
+    parser.add_argument("--lsh", action="store_true", help="also time the MinHash-LSH index (DedupeIndex(lsh=True))")
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'linear (s)':>12} {'indexed (s)':>12} {'speedup':>9} {'kept':>7}  verdicts")
+    for size in args.sizes:
+        results = make_results(size)
+        indexed_kept, indexed_time = timed(run_indexed, results)
+
+        if size <= args.linear_max:
+            linear_kept, linear_time = timed(run_linear, results)
+            same = "identical" if linear_kept == indexed_kept else "MISMATCH"
+            print(f"{size:>8} {linear_time:>12.3f} {indexed_time:>12.3f} "
+                  f"{linear_time / indexed_time:>8.1f}x {len(indexed_kept):>7}  {same}")
+        else:
+            print(f"{size:>8} {'-':>12} {indexed_time:>12.3f} {'-':>9} {len(indexed_kept):>7}  (baseline skipped)")
+
+        if args.lsh:
+            lsh_kept, lsh_time = timed(run_lsh, results)
+            print(f"{'':>8} {'lsh':>12} {lsh_time:>12.3f} {indexed_time / lsh_time:>8.1f}x {len(lsh_kept):>7}  "
+                  f"{len(lsh_kept) - len(indexed_kept)} duplicates missed")
+
+if __name__ == "__main__":
+    main()
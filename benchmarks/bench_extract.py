@@ -0,0 +1,135 @@
+"""
+Benchmark: per-page extraction time of extract_article_text before and after the
+precompiled selector index / single-pass paragraph counting.
+
+    python benchmarks/bench_extract.py                     # synthetic corpus
+    python benchmarks/bench_extract.py --corpus saved_html/ --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+
+from html_extract import extract_article_text, clean_text
+from corpus import load_corpus
+
+
+def legacy_extract_article_text(soup: BeautifulSoup, url: str) -> str:
+    """extract_article_text as it was before the precompiled engine (kept for comparison)"""
+    domain = urlparse(url).netloc.lower()
+    selectors_map = {
+        'msn.com': ['article', 'div[class*="article"]', 'div[class*="story"]', 'div[class*="content"]',
+                    'main article', 'main div[class*="article"]', '[data-t="article-body"]', '.article-body',
+                    '.articlebody', 'main .content', 'div[role="main"]', 'div[id*="article"]',
+                    'div[id*="content"]'],
+        'abc.net.au': ['article div[data-component="ArticleBody"]', 'article .article-content',
+                       'article #body', '.article__body', 'div[data-component="BodyText"]'],
+        'smh.com.au': ['article .article-body', '#article-body', 'article'],
+        'theage.com.au': ['article .article-body', 'article'],
+        'afr.com': ['article .article-content', 'article'],
+        'news.com.au': ['.story-primary', '.story-block', 'article'],
+        'theguardian.com': ['.article-body-commercial-selector', 'article'],
+        'bbc.com': ['.article__body-content', 'article'],
+        'reuters.com': ['.article-body__content', 'article'],
+        '9news.com.au': ['.article__body', 'article', '.story__body'],
+        '7news.com.au': ['.article-body', 'article'],
+    }
+    for domain_key, selectors in selectors_map.items():
+        if domain_key in domain:
+            for selector in selectors:
+                elements = soup.select(selector)
+                if elements:
+                    text = '\n\n'.join([el.get_text(strip=True, separator=' ') for el in elements])
+                    if len(text) > 200:
+                        return clean_text(text)
+
+    strategies = [
+        lambda: soup.find_all('article'),
+        lambda: soup.find_all('main'),
+        lambda: soup.find_all(['div', 'section'], class_=lambda x: x and any(
+            kw in str(x).lower() for kw in ['content', 'article', 'story', 'body', 'text', 'post']
+        )),
+        lambda: soup.find_all(['div', 'section'], attrs={'role': 'main'}),
+    ]
+    for strategy in strategies:
+        try:
+            elements = strategy()
+            if elements:
+                best_element = None
+                max_paragraphs = 0
+                for el in elements:
+                    p_count = len(el.find_all('p'))
+                    if p_count > max_paragraphs:
+                        max_paragraphs = p_count
+                        best_element = el
+                if best_element and max_paragraphs >= 3:
+                    paragraphs = best_element.find_all('p')
+                    text = '\n\n'.join([p.get_text(strip=True) for p in paragraphs])
+                    if len(text) > 200:
+                        return clean_text(text)
+        except:
+            continue
+
+    paragraphs = soup.find_all('p')
+    if len(paragraphs) >= 5:
+        text = '\n\n'.join([p.get_text(strip=True) for p in paragraphs])
+        if len(text) > 200:
+            return clean_text(text)
+    return ""
+
+
+def prepare(html: bytes) -> BeautifulSoup:
+    soup = BeautifulSoup(html, 'lxml')
+    for element in soup.find_all(['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'noscript']):
+        element.decompose()
+    return soup
+
+
+def time_extractor(extractor, pages: list, repeat: int) -> tuple:
+    """Median extraction time per page (parse excluded) and the extracted texts"""
+    per_page = []
+    texts = []
+    for name, url, html in pages:
+        samples = []
+        for _ in range(repeat):
+            soup = prepare(html)
+            start = time.perf_counter()
+            text = extractor(soup, url)
+            samples.append(time.perf_counter() - start)
+        per_page.append(statistics.median(samples))
+        texts.append(text)
+    return per_page, texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="directory of saved *.html pages (default: synthetic pages)")
+    parser.add_argument("--pages", type=int, default=60, help="synthetic pages to generate")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus, synthetic_pages=args.pages)
+    print(f"📄 {len(pages)} pages, {sum(len(p[2]) for p in pages) / 1024 / 1024:.1f} MB of HTML\n")
+
+    before, before_texts = time_extractor(legacy_extract_article_text, pages, args.repeat)
+    after, after_texts = time_extractor(extract_article_text, pages, args.repeat)
+
+    changed = sum(1 for a, b in zip(before_texts, after_texts) if a != b)
+    print(f"{'':<10} {'mean ms':>9} {'median ms':>10} {'p95 ms':>8} {'total s':>8}")
+    for label, samples in (("before", before), ("after", after)):
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        print(f"{label:<10} {statistics.mean(samples) * 1000:>9.2f} {statistics.median(samples) * 1000:>10.2f} "
+              f"{p95 * 1000:>8.2f} {sum(samples):>8.2f}")
+    print(f"\n⚡ Speedup: {sum(before) / sum(after):.1f}x | pages with different output: {changed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: HTML extraction throughput against core count.
+
+Every page of the corpus goes through extract_from_html twice per worker count N:
+  - threads:   N threads extracting in-process (the GIL serializes the parsing)
+  - processes: N fetch threads handing pages to an ExtractionPool of N worker processes
+Worker start-up is excluded (each pool is warmed first); worker recycling
+(--max-tasks-per-child) is included. Extracted texts are checked against a
+single-threaded run.
+
+    python benchmarks/bench_extract_scaling.py                          # synthetic corpus
+    python benchmarks/bench_extract_scaling.py --corpus saved_html/ --workers 1 2 4 8 --rounds 3
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from html_extract import extract_from_html
+from corpus import load_corpus
+from extraction_pool import ExtractionPool, _extract
+from metrics import set_quiet
+
+
+def worker_counts() -> list:
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+    if counts[-1] != os.cpu_count():
+        counts.append(os.cpu_count())
+    return counts
+
+
+def run(extract, pages: list, threads: int, rounds: int) -> tuple:
+    """Best-of-rounds wall time for extracting every page, and the texts"""
+    best = None
+    texts = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            texts = list(pool.map(lambda page: extract(page[2], page[1])[0], pages))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="directory of saved *.html pages (default: synthetic pages)")
+    parser.add_argument("--pages", type=int, default=200, help="synthetic pages to generate")
+    parser.add_argument("--workers", type=int, nargs="+", default=None,
+                        help="worker counts to try (default: 1, 2, 4, ... up to the CPU count)")
+    parser.add_argument("--max-tasks-per-child", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=2)
+    args = parser.parse_args()
+
+    set_quiet(True)
+    pages = load_corpus(args.corpus, synthetic_pages=args.pages)
+    print(f"📄 {len(pages)} pages, {sum(len(p[2]) for p in pages) / 1024 / 1024:.1f} MB of HTML, "
+          f"{os.cpu_count()} CPUs\n")
+
+    baseline, expected = run(extract_from_html, pages, 1, args.rounds)
+    print(f"{'Workers':>7} {'Mode':<10} {'Wall s':>8} {'Pages/s':>9} {'Speedup':>8}  Same text")
+    for n in args.workers or worker_counts():
+        elapsed, texts = run(extract_from_html, pages, n, args.rounds)
+        print(f"{n:>7} {'threads':<10} {elapsed:>8.2f} {len(pages) / elapsed:>9.1f} "
+              f"{baseline / elapsed:>7.2f}x  {texts == expected}")
+
+        pool = ExtractionPool(processes=n, max_tasks_per_child=args.max_tasks_per_child)
+        # Submit directly so N=1 also goes through a worker process (extract() would stay in-process)
+        extract = lambda html, url: pool._pool().submit(_extract, html, url).result()[:2]
+        try:
+            run(extract, pages[:n], n, 1)  # start the workers and import the parser stack
+            elapsed, texts = run(extract, pages, n, args.rounds)
+        finally:
+            pool.shutdown()
+        print(f"{n:>7} {'processes':<10} {elapsed:>8.2f} {len(pages) / elapsed:>9.1f} "
+              f"{baseline / elapsed:>7.2f}x  {texts == expected}")
+
+
+if __name__ == "__main__":
+    main()
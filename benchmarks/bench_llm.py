@@ -0,0 +1,84 @@
+"""
+Benchmark: summarization throughput against the local fake Groq server.
+
+Compares the old pattern (one blocking call per article with a fixed 1 s pause, no
+retries) with the rate-limited async client at LLM_CONCURRENCY, and counts how many
+requests the server rejected with 429.
+
+    python benchmarks/bench_llm.py --articles 40 --rpm 60 --latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import groq
+
+from fake_groq import start_server
+from llm_client import LLMClient
+
+ARTICLE = "Hospital network announces remote patient monitoring rollout. " * 60
+
+
+def run_fixed_sleep(base_url: str, count: int) -> tuple:
+    client = groq.Groq(api_key="fake", base_url=base_url, max_retries=0)
+    ok = 0
+    for _ in range(count):
+        try:
+            client.chat.completions.create(
+                model="fake", messages=[{"role": "user", "content": ARTICLE}], max_tokens=300,
+            )
+            ok += 1
+        except groq.APIError:
+            pass
+        time.sleep(1)
+    return ok, count - ok
+
+
+async def run_async(client: LLMClient, count: int) -> tuple:
+    async def one():
+        try:
+            await client.acomplete(ARTICLE, "fake", 0.3, max_tokens=300)
+            return True
+        except groq.APIError:
+            return False
+
+    results = await asyncio.gather(*(one() for _ in range(count)))
+    return sum(results), count - sum(results)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=40)
+    parser.add_argument("--rpm", type=float, default=60, help="server-side limit")
+    parser.add_argument("--client-rpm", type=float, default=None, help="client budget (default: --rpm)")
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--skip-baseline", action="store_true")
+    args = parser.parse_args()
+
+    if not args.skip_baseline:
+        server = start_server(rpm=args.rpm, latency=args.latency)
+        start = time.perf_counter()
+        ok, failed = run_fixed_sleep(server.base_url, args.articles)
+        elapsed = time.perf_counter() - start
+        print(f"fixed 1s sleep : {elapsed:6.1f}s  ok={ok} failed={failed} server={server.counts}")
+        server.shutdown()
+
+    server = start_server(rpm=args.rpm, latency=args.latency)
+    client = LLMClient(api_key="fake", base_url=server.base_url,
+                       requests_per_minute=args.client_rpm or args.rpm,
+                       tokens_per_minute=10 ** 7, concurrency=args.concurrency)
+    start = time.perf_counter()
+    ok, failed = asyncio.run(run_async(client, args.articles))
+    elapsed = time.perf_counter() - start
+    print(f"async + bucket : {elapsed:6.1f}s  ok={ok} failed={failed} server={server.counts}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
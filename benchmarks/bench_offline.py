@@ -0,0 +1,191 @@
+"""
+Benchmark: the whole pipeline end to end without network access.
+
+Search requests, article downloads and DDG results are answered from a fixture set
+(benchmarks/fixtures.py) and summaries come from the local fake Groq server, so runs are
+repeatable and comparable. Reports items, wall time, throughput, per-item latency
+percentiles and peak traced memory for each stage: search_news, fetch_article_text,
+summarize and save_doc.
+
+    python benchmarks/bench_offline.py                       # synthetic fixtures in a temp dir
+    python benchmarks/bench_offline.py --generate fixtures/  # write a synthetic set to keep
+    python benchmarks/bench_offline.py --record fixtures/    # capture live responses (network)
+    python benchmarks/bench_offline.py --fixtures fixtures/ --net-latency 0.05 --llm-latency 0.4 --json out.json
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("GROQ_API_KEY", "fake")
+
+from config import SEARCH_QUERIES, FETCH_WORKERS, SUMMARIZE_WORKERS
+from fake_groq import start_server
+from fixtures import Fixtures, generate_fixtures, record_fixtures, install_replay
+from metrics import set_quiet
+
+
+def percentile(ordered: list, fraction: float) -> float:
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)] if ordered else 0.0
+
+
+class Stage:
+    """Wall time, per-item latencies and traced peak memory for one pipeline stage"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies = []
+        self.items = 0
+        self.wall = 0.0
+        self.peak = 0
+        self.note = ""
+
+    def __enter__(self):
+        tracemalloc.reset_peak()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.wall = time.perf_counter() - self._start
+        self.peak = tracemalloc.get_traced_memory()[1]
+        return False
+
+    def timed(self, func, *args):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+    def to_dict(self) -> dict:
+        ordered = sorted(self.latencies)
+        return {
+            "items": self.items,
+            "wall_s": self.wall,
+            "items_per_s": self.items / self.wall if self.wall else 0.0,
+            "p50_ms": percentile(ordered, 0.5) * 1000,
+            "p95_ms": percentile(ordered, 0.95) * 1000,
+            "max_ms": (ordered[-1] if ordered else 0.0) * 1000,
+            "peak_mb": self.peak / 1e6,
+            "note": self.note,
+        }
+
+
+def run_search(fixtures: Fixtures, stage: Stage, search_cache: bool = False) -> list:
+    import search
+
+    search.SEARCH_QUERIES = list(fixtures.index["rss"])
+    if not search_cache:
+        search.search_cache = None
+    if fixtures.recorded:
+        # Recorded dates age; keep every result so runs stay comparable
+        search.TIME_FILTER = None
+    results = stage.timed(search.search_news)
+    stage.items = len(results)
+    return results
+
+
+def run_pool(stage: Stage, func, inputs: list, workers: int) -> list:
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        outputs = list(pool.map(lambda value: stage.timed(func, value), inputs))
+    stage.items = len(inputs)
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", help="existing fixture directory (default: generate a synthetic set)")
+    parser.add_argument("--generate", metavar="DIR", help="write a synthetic fixture set to DIR and use it")
+    parser.add_argument("--record", metavar="DIR", help="record live responses to DIR and use them")
+    parser.add_argument("--per-query", type=int, default=12, help="synthetic RSS results per query")
+    parser.add_argument("--net-latency", type=float, default=0.0, help="seconds added to each replayed request")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="fake Groq seconds per completion")
+    parser.add_argument("--limit", type=int, default=0, help="only fetch/summarize the top N results")
+    parser.add_argument("--polite", action="store_true", help="keep per-host pacing (HOST_MIN_INTERVAL)")
+    parser.add_argument("--search-cache", action="store_true", help="keep the search response cache (.cache/search.sqlite)")
+    parser.add_argument("--json", help="also write the stage table as JSON")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="news_bench_")
+    directory = args.fixtures or args.generate or args.record or os.path.join(workdir, "fixtures")
+    if args.record:
+        print(f"📼 Recording live fixtures to {directory} ...")
+        record_fixtures(directory, SEARCH_QUERIES)
+    elif not args.fixtures:
+        generate_fixtures(directory, SEARCH_QUERIES, args.per_query)
+    fixtures = Fixtures(directory)
+    print(f"📦 Fixtures: {directory} ({len(fixtures.index['pages'])} pages, "
+          f"{len(fixtures.index['rss'])} queries, {'recorded' if fixtures.recorded else 'synthetic'})")
+
+    install_replay(fixtures, args.net_latency)
+
+    import article_fetcher
+    import summarizer
+    from llm_client import LLMClient
+    from politeness import host_scheduler
+    from storage import save_doc
+
+    # Measure real work on every run: no cross-run caches, no pacing unless asked
+    article_fetcher.article_cache = None
+    summarizer.summary_cache = None
+    if not args.polite:
+        host_scheduler.min_interval = 0.0
+    server = start_server(latency=args.llm_latency, rpm=100000)
+    summarizer.llm = LLMClient(base_url=server.base_url, requests_per_minute=100000, tokens_per_minute=10 ** 9)
+
+    set_quiet(True)
+    tracemalloc.start()
+    stages = []
+
+    with Stage("search") as stage:
+        results = run_search(fixtures, stage, args.search_cache)
+    stages.append(stage)
+    if args.limit:
+        results = results[:args.limit]
+
+    with Stage("fetch") as stage:
+        texts = run_pool(stage, article_fetcher.fetch_article_text, [r["link"] for r in results], FETCH_WORKERS)
+    stage.note = f"{sum(1 for t in texts if t)} extracted"
+    stages.append(stage)
+
+    fetched = [(r, t) for r, t in zip(results, texts) if t]
+    with Stage("summarize") as stage:
+        summaries = run_pool(stage, summarizer.summarize, [t for _, t in fetched], SUMMARIZE_WORKERS)
+    stages.append(stage)
+
+    records = [{"Title": r.get("title", "Untitled"), "Summary": s, "Link": r.get("link", ""),
+                "Date": r.get("date", "")} for (r, _), s in zip(fetched, summaries)]
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        with Stage("save_doc") as stage:
+            stage.timed(save_doc, records)
+            stage.items = len(records)
+    finally:
+        os.chdir(cwd)
+    stages.append(stage)
+
+    tracemalloc.stop()
+    server.shutdown()
+
+    print(f"\n{'Stage':<10} {'Items':>6} {'Wall s':>8} {'Items/s':>9} {'p50 ms':>9} {'p95 ms':>9} "
+          f"{'Max ms':>9} {'Peak MB':>8}")
+    for stage in stages:
+        s = stage.to_dict()
+        print(f"{stage.name:<10} {s['items']:>6} {s['wall_s']:>8.2f} {s['items_per_s']:>9.1f} {s['p50_ms']:>9.1f} "
+              f"{s['p95_ms']:>9.1f} {s['max_ms']:>9.1f} {s['peak_mb']:>8.1f}  {s['note']}")
+    print(f"LLM requests served: {server.counts}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({stage.name: stage.to_dict() for stage in stages}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: relevance scoring throughput.
+
+Compares three ways of scoring titles against the keyword table, each followed by the
+ranking step:
+  - per-keyword scan: one regex search per keyword for every title, then sort twice
+    and filter (the shape of the old search_news loop)
+  - combined regex: a single longest-first alternation of every keyword
+  - keywords.score_items: compiled word-phrase tables, filter, one sort / top-k
+The combined regex and score_items use the same longest-match rule, so their rankings
+are checked to be identical.
+
+    python benchmarks/bench_scoring.py
+    python benchmarks/bench_scoring.py --titles 10000 --top-k 50
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from keywords import (
+    DOMAINS, KEYWORDS, PENALTIES, TITLE_WEIGHTS, SOURCE_WEIGHTS, SOURCE_MAX_WORDS,
+    host_bonus, match_phrases, score_items,
+)
+
+FILLER = (
+    "announces launches new plan for state government reveals study shows rollout across rural "
+    "residents local council weather update market report football season final week"
+).split()
+SOURCES = ["ABC News", "The Sydney Morning Herald", "DuckDuckGo", "Healthcare IT News", "news.com.au", "Reuters"]
+HOSTS = ["www.abc.net.au", "www.smh.com.au", "news.google.com", "www.healthcareit.com.au", "www.example.com"]
+
+
+def make_items(n: int, seed: int = 5) -> list:
+    rng = random.Random(seed)
+    terms = list(KEYWORDS) + list(PENALTIES)
+    items = []
+    for i in range(n):
+        words = rng.sample(FILLER, rng.randint(4, 9)) + rng.sample(terms, rng.randint(0, 3))
+        rng.shuffle(words)
+        items.append({
+            "title": " ".join(words).capitalize() + f" - {rng.choice(SOURCES)}",
+            "link": f"https://{rng.choice(HOSTS)}/news/{i}",
+            "source": rng.choice(SOURCES),
+        })
+    return items
+
+
+# Per-keyword patterns, as a loop over the keyword lists would build them
+TERM_PATTERNS = [(re.compile(rf"(?<!\w){re.escape(t)}(?!\w)", re.IGNORECASE), w) for t, w in TITLE_WEIGHTS.items()]
+# The same keywords as one alternation, longest first
+COMBINED = re.compile(
+    "|".join(rf"(?<!\w){re.escape(t)}(?!\w)" for t in sorted(TITLE_WEIGHTS, key=len, reverse=True)), re.IGNORECASE
+)
+
+
+def publisher_bonus(item: dict) -> float:
+    """Shared by every method, so the timings differ only in title matching and ranking"""
+    bonuses = [SOURCE_WEIGHTS[term] for term in match_phrases(item["source"], SOURCE_WEIGHTS, SOURCE_MAX_WORDS)]
+    host = host_bonus(item["link"])
+    if host is not None:
+        bonuses.append(host)
+    return max(bonuses) if bonuses else 0.0
+
+
+def naive_score(item: dict) -> float:
+    score = sum(weight for pattern, weight in TERM_PATTERNS if pattern.search(item["title"]))
+    return round(score + publisher_bonus(item), 2)
+
+
+def regex_score(item: dict) -> float:
+    score = sum(TITLE_WEIGHTS[term] for term in {m.lower() for m in COMBINED.findall(item["title"])})
+    return round(score + publisher_bonus(item), 2)
+
+
+def loop_rank(score, items: list, min_score: float, top_k: int) -> list:
+    for item in items:
+        item["relevance_score"] = score(item)
+    items = sorted(items, key=lambda x: x["relevance_score"], reverse=True)
+    items = sorted(items, key=lambda x: x["relevance_score"], reverse=True)
+    items = [item for item in items if item["relevance_score"] > min_score]
+    return items[:top_k] if top_k else items
+
+
+def best_of(func, repeat: int) -> tuple:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--titles", type=int, default=10000)
+    parser.add_argument("--min-score", type=float, default=1)
+    parser.add_argument("--top-k", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    items = make_items(args.titles)
+    runs = [
+        ("per-keyword scan", lambda batch: loop_rank(naive_score, batch, args.min_score, args.top_k)),
+        ("combined regex", lambda batch: loop_rank(regex_score, batch, args.min_score, args.top_k)),
+        ("score_items", lambda batch: score_items(batch, args.min_score, args.top_k)),
+    ]
+
+    print(f"{args.titles} titles, {len(TITLE_WEIGHTS)} keywords, {len(DOMAINS)} domains "
+          f"(min score {args.min_score}, top_k {args.top_k})")
+    print(f"{'Method':<20} {'Time ms':>9} {'Titles/s':>12} {'Kept':>6}")
+    ranked = {}
+    baseline = None
+    for name, run in runs:
+        elapsed, kept = best_of(lambda: run([dict(i) for i in items]), args.repeat)
+        ranked[name] = [i["link"] for i in kept]
+        baseline = baseline or elapsed
+        print(f"{name:<20} {elapsed * 1000:>9.1f} {args.titles / elapsed:>12,.0f} {len(kept):>6}"
+              f"  {baseline / elapsed:.1f}x")
+    print(f"combined regex and score_items rank identically: {ranked['combined regex'] == ranked['score_items']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: CLI startup cost per command.
+
+Each case runs in a fresh interpreter: `import main` plus the stage modules a command
+loads before it starts working. "eager" imports every stage up front, as main.py did
+before imports were deferred. Reports the median wall time and which heavy packages
+ended up loaded.
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 15
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = ["requests", "bs4", "lxml", "newspaper", "cloudscraper", "feedparser", "ddgs", "groq", "docx", "asyncio"]
+
+# Imports each command performs before doing any work
+CASES = [
+    ("python (no imports)", ""),
+    ("main.py --help", "import main"),
+    ("search", "import main, search; search.ddgs_class(); import feedparser"),
+    ("fetch", "import main, article_fetcher, http_session"),
+    ("summarize", "import main, summarizer, llm_client; import groq"),
+    ("report", "import main, report_writers; import docx"),
+    ("eager (all stages)", "import main, search, article_fetcher, summarizer, report_writers, http_session, "
+                           "llm_client, feedparser, ddgs, newspaper, cloudscraper, groq, docx"),
+]
+
+
+def run_case(code: str) -> tuple:
+    probe = f"{code}\nimport sys\nprint(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    env = dict(os.environ, GROQ_API_KEY="", PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return time.perf_counter() - start, out.stdout.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    run_case(CASES[-1][1])  # warm the bytecode and file system caches
+
+    results = []
+    for name, code in CASES:
+        timings = []
+        loaded = ""
+        for _ in range(args.repeat):
+            elapsed, loaded = run_case(code)
+            timings.append(elapsed)
+        results.append((name, statistics.median(timings), loaded))
+
+    eager = results[-1][1]
+    print(f"{'Command':<22} {'Median ms':>10} {'Avoided ms':>11}  Heavy packages loaded")
+    for name, median, loaded in results:
+        print(f"{name:<22} {median * 1000:>10.0f} {(eager - median) * 1000:>11.0f}  {loaded or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+HTML page corpus shared by the extraction benchmarks.
+
+Saved pages are read from a directory of *.html files. An optional urls.json in the
+same directory maps file names to the original article URLs (so site-specific
+selectors apply); otherwise the URL is derived from the file name. Without a
+directory, a synthetic corpus of news-like pages is generated.
+"""
+import json
+import os
+import random
+
+SYNTHETIC_DOMAINS = [
+    "www.abc.net.au", "www.smh.com.au", "www.msn.com", "www.news.com.au",
+    "www.9news.com.au", "www.theguardian.com", "www.example-health.com.au",
+]
+
+SENTENCE_WORDS = (
+    "the hospital said patients digital health record system rollout will improve care across "
+    "regional clinics after federal funding was announced on tuesday by the minister for health "
+    "and aged care with clinicians welcoming telehealth expansion data privacy concerns remain"
+).split()
+
+
+def load_corpus(directory: str = None, synthetic_pages: int = 60, seed: int = 7) -> list:
+    """Return a list of (name, url, html_bytes)"""
+    if directory:
+        urls = {}
+        index_path = os.path.join(directory, "urls.json")
+        if os.path.exists(index_path):
+            with open(index_path, encoding="utf-8") as f:
+                urls = json.load(f)
+
+        pages = []
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".html"):
+                continue
+            with open(os.path.join(directory, name), "rb") as f:
+                html = f.read()
+            url = urls.get(name) or f"https://{name[:-5].split('__')[0]}/{name[:-5]}"
+            pages.append((name, url, html))
+        return pages
+
+    rng = random.Random(seed)
+    return [
+        (f"synthetic_{i}.html", f"https://{SYNTHETIC_DOMAINS[i % len(SYNTHETIC_DOMAINS)]}/story/{i}",
+         synthetic_page(rng))
+        for i in range(synthetic_pages)
+    ]
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(SENTENCE_WORDS) for _ in range(rng.randint(12, 30))).capitalize() + "."
+
+
+def synthetic_page(rng: random.Random) -> bytes:
+    """A large news page: deep nested layout divs, boilerplate, scripts and an article body"""
+    parts = ["<html><head><title>Story</title>"]
+    parts += [f"<script>var x{i} = {'{'}'k': '{'v' * 200}'{'}'};</script>" for i in range(20)]
+    parts.append("<style>.a{color:red}</style></head><body>")
+    parts.append("<header><nav>" + "".join(f"<a href='/s{i}'>Section {i}</a>" for i in range(60)) + "</nav></header>")
+
+    # Deeply nested layout wrappers with teaser paragraphs
+    depth = rng.randint(20, 40)
+    for level in range(depth):
+        parts.append(f"<div class='layout-content-wrapper level-{level}'>")
+        for _ in range(rng.randint(1, 3)):
+            parts.append(f"<div class='teaser-story-card'><p>{_sentence(rng)}</p></div>")
+
+    # Half the pages use semantic markup, the rest only generic containers
+    semantic = rng.random() < 0.5
+    parts.append("<main><article><div class='article-body' data-component='ArticleBody'>" if semantic
+                 else "<div class='story-text'>")
+    for _ in range(rng.randint(15, 60)):
+        parts.append(f"<p>{' '.join(_sentence(rng) for _ in range(rng.randint(1, 4)))}</p>")
+    parts.append("</div></article></main>" if semantic else "</div>")
+
+    parts.append("</div>" * depth)
+    parts.append("<aside>" + "".join(f"<p>Related {i}</p>" for i in range(40)) + "</aside>")
+    parts.append("<footer><p>Copyright</p></footer></body></html>")
+    return "".join(parts).encode("utf-8")
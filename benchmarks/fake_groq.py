@@ -0,0 +1,137 @@
+"""
+Local stand-in for the Groq chat-completions endpoint, for exercising llm_client
+without an API key. Enforces a requests-per-minute budget with 429 + Retry-After,
+adds configurable latency and can fail a share of requests with 503.
+
+    python benchmarks/fake_groq.py --port 8766 --rpm 60 --latency 0.3
+    GROQ_BASE_URL=http://127.0.0.1:8766 GROQ_API_KEY=x python main.py
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SUMMARY = """- The article reports a new digital health development.
+- A named organisation announced specific outcomes and figures.
+- The change affects patients and clinicians in the region.
+One to watch for anyone following health technology."""
+
+
+class FakeGroqServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, rpm: float = 60, latency: float = 0.2, error_rate: float = 0.0):
+        super().__init__(address, FakeGroqHandler)
+        self.rpm = rpm
+        self.latency = latency
+        self.error_rate = error_rate
+        self.window = deque()
+        self.lock = threading.Lock()
+        self.counts = {"ok": 0, "rate_limited": 0, "errors": 0}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def admit(self) -> float:
+        """0 if the request fits the sliding one-minute window, else seconds until it would"""
+        with self.lock:
+            now = time.monotonic()
+            while self.window and now - self.window[0] >= 60:
+                self.window.popleft()
+            if len(self.window) >= self.rpm:
+                return 60 - (now - self.window[0])
+            self.window.append(now)
+            return 0.0
+
+    def count(self, key: str):
+        with self.lock:
+            self.counts[key] += 1
+
+
+class FakeGroqHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status: int, body: dict, headers: dict = None):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+
+        if not self.path.endswith("/chat/completions"):
+            self.send_json(404, {"error": {"message": "not found"}})
+            return
+
+        wait = self.server.admit()
+        if wait:
+            self.server.count("rate_limited")
+            self.send_json(429, {"error": {"message": "Rate limit reached", "type": "requests"}},
+                           {"Retry-After": str(math.ceil(wait))})
+            return
+
+        time.sleep(self.server.latency)
+        if random.random() < self.server.error_rate:
+            self.server.count("errors")
+            self.send_json(503, {"error": {"message": "Service unavailable"}})
+            return
+
+        self.server.count("ok")
+        prompt = request["messages"][-1]["content"]
+        self.send_json(200, {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": SUMMARY},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": len(prompt) // 4,
+                "completion_tokens": len(SUMMARY) // 4,
+                "total_tokens": (len(prompt) + len(SUMMARY)) // 4,
+            },
+        })
+
+
+def start_server(port: int = 0, **options) -> FakeGroqServer:
+    """Start a fake server on a background thread (port 0 picks a free port)"""
+    server = FakeGroqServer(("127.0.0.1", port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--rpm", type=float, default=60, help="requests per minute before answering 429")
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds per completion")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 503")
+    args = parser.parse_args()
+
+    server = FakeGroqServer(("127.0.0.1", args.port), rpm=args.rpm, latency=args.latency,
+                            error_rate=args.error_rate)
+    print(f"Fake Groq API on {server.base_url} (set GROQ_BASE_URL to this)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n{server.counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Recorded (or generated) network fixtures for offline benchmark runs.
+
+A fixture directory holds index.json plus the response bodies it points to:
+
+    {"recorded": false,
+     "rss":   {"<query>": "rss/0.xml", ...},      Google News RSS bodies
+     "ddg":   {"<query>": "ddg/0.json", ...},     DuckDuckGo news result lists
+     "pages": {"<url>": {"file": "pages/0.html", "status": 200}, ...}}
+
+generate_fixtures() writes a synthetic set; record_fixtures() captures live responses
+(needs network access). install_replay() points the shared HTTP sessions and the DDG
+client at a fixture set, so the pipeline runs without touching the network.
+"""
+import hashlib
+import io
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+import cloudscraper
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from corpus import synthetic_page, _sentence
+
+HEALTH_TOPICS = [
+    "telehealth", "digital health", "health AI", "remote patient monitoring", "wearable devices",
+    "health data", "clinical decision support", "medical devices", "health funding", "telemedicine",
+]
+PUBLISHERS = [
+    "www.abc.net.au", "www.smh.com.au", "www.msn.com", "www.news.com.au", "www.9news.com.au",
+    "www.theguardian.com", "www.theage.com.au", "www.afr.com", "www.reuters.com", "www.bbc.com",
+    "www.healthcareit.com.au", "www.pulseit.news", "www.mobihealthnews.com", "www.example-health.com.au",
+]
+
+
+def google_rss_url(query: str) -> str:
+    """The URL search.search_google_news_rss requests for a query"""
+    return f"https://news.google.com/rss/search?q={requests.utils.quote(query)}&hl=en-AU"
+
+
+def _write(directory: str, relative: str, data: bytes):
+    path = os.path.join(directory, relative)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def generate_fixtures(directory: str, queries: list, per_query: int = 12, seed: int = 11) -> dict:
+    """
+    Write a synthetic fixture set: an RSS feed and a DDG result list per query (with some
+    stories repeated across queries and providers), recent and stale dates, and one HTML
+    page per article link. About 5% of pages answer 403 to exercise strategy fallbacks.
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    index = {"recorded": False, "rss": {}, "ddg": {}, "pages": {}}
+    stories = []
+
+    def story():
+        # Reuse an earlier story a fifth of the time so dedupe has work to do
+        if stories and rng.random() < 0.2:
+            return rng.choice(stories)
+        n = len(stories)
+        topic = rng.choice(HEALTH_TOPICS)
+        publisher = rng.choice(PUBLISHERS)
+        age = timedelta(hours=rng.uniform(0, 20)) if rng.random() < 0.9 else timedelta(days=rng.uniform(3, 20))
+        entry = {
+            "title": f"Australian {topic}: {' '.join(_sentence(rng).rstrip('.').split()[:9])}",
+            "link": f"https://{publisher}/news/health/{n}-{topic.replace(' ', '-').lower()}",
+            "published": now - age,
+            "source": publisher[4:],
+        }
+        stories.append(entry)
+        return entry
+
+    for q, query in enumerate(queries):
+        rss_items = [story() for _ in range(per_query)]
+        ddg_items = [story() for _ in range(per_query // 2)]
+
+        items_xml = "".join(
+            f"<item><title>{escape(s['title'])} - {escape(s['source'])}</title><link>{escape(s['link'])}</link>"
+            f"<pubDate>{format_datetime(s['published'])}</pubDate>"
+            f"<source url=\"https://{escape(s['source'])}\">{escape(s['source'])}</source></item>"
+            for s in rss_items
+        )
+        rss = (f"<?xml version=\"1.0\" encoding=\"UTF-8\"?><rss version=\"2.0\"><channel>"
+               f"<title>{escape(query)}</title>{items_xml}</channel></rss>")
+        _write(directory, f"rss/{q}.xml", rss.encode("utf-8"))
+        index["rss"][query] = f"rss/{q}.xml"
+
+        ddg = [{"title": s["title"], "url": s["link"], "date": s["published"].isoformat(), "source": s["source"]}
+               for s in ddg_items]
+        _write(directory, f"ddg/{q}.json", json.dumps(ddg).encode("utf-8"))
+        index["ddg"][query] = f"ddg/{q}.json"
+
+    for n, s in enumerate(stories):
+        if s["link"] in index["pages"]:
+            continue
+        _write(directory, f"pages/{n}.html", synthetic_page(rng))
+        index["pages"][s["link"]] = {"file": f"pages/{n}.html", "status": 403 if rng.random() < 0.05 else 200}
+
+    with open(os.path.join(directory, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1)
+    return index
+
+
+def record_fixtures(directory: str, queries: list, max_pages: int = 100) -> dict:
+    """Capture live Google News RSS, DuckDuckGo results and article HTML into a fixture set"""
+    from ddgs import DDGS
+
+    index = {"recorded": True, "rss": {}, "ddg": {}, "pages": {}}
+    session = requests.Session()
+    links = []
+
+    for q, query in enumerate(queries):
+        response = session.get(google_rss_url(query), timeout=20)
+        _write(directory, f"rss/{q}.xml", response.content)
+        index["rss"][query] = f"rss/{q}.xml"
+
+        with DDGS(timeout=20) as ddgs:
+            ddg = list(ddgs.news(query, region="au-en", timelimit="w", max_results=15))
+        _write(directory, f"ddg/{q}.json", json.dumps(ddg).encode("utf-8"))
+        index["ddg"][query] = f"ddg/{q}.json"
+        links += [r.get("url") for r in ddg if r.get("url")]
+
+    for n, url in enumerate(dict.fromkeys(links)):
+        if n >= max_pages:
+            break
+        try:
+            response = session.get(url, timeout=20, headers={"User-Agent": "Mozilla/5.0"})
+        except requests.RequestException:
+            continue
+        _write(directory, f"pages/{n}.html", response.content)
+        index["pages"][url] = {"file": f"pages/{n}.html", "status": response.status_code}
+
+    with open(os.path.join(directory, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1)
+    return index
+
+
+class Fixtures:
+    """Loaded fixture set: response bodies by URL and DDG result lists by query"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, "index.json"), encoding="utf-8") as f:
+            self.index = json.load(f)
+        self.responses = {}
+        for query, path in self.index["rss"].items():
+            self.responses[google_rss_url(query)] = (200, self._read(path), "application/rss+xml")
+        for url, page in self.index["pages"].items():
+            self.responses[url] = (page["status"], self._read(page["file"]), "text/html; charset=utf-8")
+        self.ddg = {query: json.loads(self._read(path)) for query, path in self.index["ddg"].items()}
+
+    def _read(self, relative: str) -> bytes:
+        with open(os.path.join(self.directory, relative), "rb") as f:
+            return f.read()
+
+    @property
+    def recorded(self) -> bool:
+        return self.index.get("recorded", False)
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    Transport adapter answering every request from fixtures (404 for unknown URLs).
+    Responses carry an ETag of their body, and a matching If-None-Match gets a 304.
+    """
+
+    def __init__(self, fixtures: Fixtures, latency: float = 0.0):
+        super().__init__()
+        self.fixtures = fixtures
+        self.latency = latency
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.latency:
+            time.sleep(self.latency)
+        status, body, content_type = self.fixtures.responses.get(request.url, (404, b"not found", "text/plain"))
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        if status == 200 and request.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers={"Content-Type": content_type, "Content-Length": str(len(body)), "ETag": etag},
+            status=status,
+            preload_content=False,
+            decode_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+class FakeDDGS:
+    """Stand-in for ddgs.DDGS returning recorded news results"""
+
+    fixtures = None
+    latency = 0.0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def news(self, query, region=None, timelimit=None, max_results=None):
+        if self.latency:
+            time.sleep(self.latency)
+        return list(self.fixtures.ddg.get(query, []))[:max_results]
+
+
+def install_replay(fixtures: Fixtures, latency: float = 0.0):
+    """Route the shared HTTP sessions, per-thread cloudscraper sessions and DDG searches to fixtures"""
+    import search
+    from http_session import sessions
+
+    def mount(session):
+        adapter = ReplayAdapter(fixtures, latency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    local = threading.local()
+
+    def scraper():
+        if getattr(local, "scraper", None) is None:
+            local.scraper = mount(cloudscraper.create_scraper())
+        return local.scraper
+
+    sessions._session = mount(requests.Session())
+    sessions.scraper = scraper
+
+    FakeDDGS.fixtures = fixtures
+    FakeDDGS.latency = latency
+    search.DDGS = FakeDDGS
@@ -0,0 +1,97 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+
+class Checkpoint:
+    """
+    Append-only JSONL log of a run, so a crashed or killed run can be resumed.
+
+    The first line holds the run's search results (and the indices left out of the
+    report); every processed article then appends one line with its index and output
+    record, flushed and fsynced before the next one. A truncated last line from a
+    crash is ignored on load and cut off before appending on resume. Safe to share
+    between threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def start(self, results: list, skip: list = ()):
+        """Begin a new checkpoint for these search results, replacing any previous one"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.close()
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._write({
+            "type": "run",
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "results": results,
+            "skip": sorted(skip),
+        })
+
+    def resume(self) -> tuple:
+        """
+        Load an existing checkpoint and reopen it for appending.
+        Returns (results, {index: record}, skipped indices).
+        """
+        results, records, skip, end = self._read(self.path)
+        self.close()
+        self._file = open(self.path, "a", encoding="utf-8")
+        # Drop a partial last line, or the next record would be glued onto it and lost too
+        self._file.truncate(end)
+        return results, records, skip
+
+    @staticmethod
+    def load(path: str) -> tuple:
+        """Read a checkpoint file. Returns (results, {index: record}, skipped indices)."""
+        return Checkpoint._read(path)[:3]
+
+    @staticmethod
+    def _read(path: str) -> tuple:
+        """load() plus the byte offset just past the last complete line"""
+        results = None
+        records = {}
+        skip = set()
+        end = 0
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partially written last line from an interrupted run
+                end += len(line)
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("type") == "run":
+                    results = entry["results"]
+                    skip = set(entry.get("skip", []))
+                elif entry.get("type") == "record":
+                    records[entry["index"]] = entry["record"]
+
+        if results is None:
+            raise ValueError(f"{path} has no run header")
+        return results, records, skip, end
+
+    def append(self, index: int, record: dict):
+        """Durably record the output for results[index]"""
+        self._write({"type": "record", "index": index, "record": record})
+
+    def _write(self, entry: dict):
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -33,4 +33,109 @@ TIME_FILTER = "d"  # 'd' = past day, 'w' = past week, 'm' = past month
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-}
\ No newline at end of file
+}
+# Processing pipeline: fetch and summarize stages run concurrently when enabled
+PIPELINE_MODE = True
+FETCH_WORKERS = 8       # concurrent article downloads
+SUMMARIZE_WORKERS = 2   # concurrent Groq summarization calls
+
+# Search fan-out: queries x providers run concurrently when enabled
+SEARCH_CONCURRENT = True
+SEARCH_WORKERS = 8  # global limit on in-flight provider requests
+SEARCH_PROVIDER_LIMITS = {"google": 4, "duckduckgo": 2}
+
+# Persistent caches (SQLite files under CACHE_DIR)
+CACHE_DIR = ".cache"
+ARTICLE_CACHE_ENABLED = True
+ARTICLE_CACHE_TTL_HOURS = 24 * 7
+ARTICLE_CACHE_MAX_MB = 200
+SUMMARY_CACHE_ENABLED = True
+SUMMARY_CACHE_TTL_HOURS = 24 * 30
+SUMMARY_CACHE_MAX_MB = 50
+
+# Summarization model settings (part of the summary cache key)
+GROQ_MODEL = "groq/compound-mini"
+SUMMARY_TEMPERATURE = 0.3
+
+# Shared HTTP connection pools
+HTTP_POOL_HOSTS = 50    # hosts kept in the pool manager
+HTTP_POOL_MAXSIZE = 16  # keep-alive connections per host (>= FETCH_WORKERS)
+
+# Adaptive fetch strategy ordering per domain (stats persist in CACHE_DIR)
+ADAPTIVE_STRATEGIES = True
+STRATEGY_SKIP_MIN_ATTEMPTS = 5   # attempts before a strategy can be skipped on a domain
+STRATEGY_SKIP_MAX_RATE = 0.1     # skip strategies at or below this success rate
+
+# HTML download limits
+MAX_HTML_BYTES = 2 * 1024 * 1024  # stop reading page bodies past this size
+STREAMING_EXTRACTION = False      # parse while downloading and stop once enough text is collected
+STREAM_TARGET_CHARS = 12000       # article text to collect before stopping (summarizer uses ~8000)
+
+# Batched summarization: short articles share one Groq request
+SUMMARY_BATCH_MODE = False
+SUMMARY_BATCH_TOKEN_BUDGET = 6000       # estimated prompt tokens per batched request
+SUMMARY_BATCH_MAX_ARTICLES = 6
+SUMMARY_BATCH_ARTICLE_MAX_CHARS = 3000  # longer articles are summarized on their own
+
+# Groq API client: request budgets, retries and concurrency
+GROQ_BASE_URL = os.getenv("GROQ_BASE_URL")  # None = api.groq.com; point at a local fake server for testing
+GROQ_REQUESTS_PER_MINUTE = 30
+GROQ_TOKENS_PER_MINUTE = 30000   # estimated prompt tokens + max_tokens per request
+LLM_ASYNC = True                 # pipelined mode summarizes on an asyncio client instead of SUMMARIZE_WORKERS threads
+LLM_CONCURRENCY = 4              # in-flight async summarization requests
+LLM_MAX_RETRIES = 5              # retries on 429 / 5xx / timeouts
+LLM_BACKOFF_BASE = 1.0           # seconds; exponential backoff with full jitter
+LLM_BACKOFF_MAX = 60.0
+
+# Summarizer input preparation: boilerplate/duplicate paragraphs are dropped and the most
+# informative paragraphs kept up to this many estimated tokens (was a fixed 8000-character cut)
+SUMMARY_INPUT_TOKEN_BUDGET = 1500
+
+# Incremental runs: articles summarized by earlier runs are remembered in a SQLite state store
+INCREMENTAL_MODE = True          # only fetch and summarize articles not processed before
+MERGE_PREVIOUS_SUMMARIES = True  # include stored summaries of already processed results in the report
+STATE_DB_PATH = "news_state.sqlite"
+STATE_RETENTION_DAYS = 90        # forget articles not seen in search results for this long
+
+# Crash-safe checkpoint: one JSONL line per processed article; `python main.py --resume` continues from it
+CHECKPOINT_PATH = "run_checkpoint.jsonl"
+
+# Report outputs, written incrementally as articles finish: "docx", "jsonl", "md", "html", "xlsx"
+REPORT_FORMATS = ["docx"]
+
+# Per-host politeness: pacing, concurrency cap and backoff on refusals (replaces fixed sleeps)
+HOST_MIN_INTERVAL = 1.0       # seconds between request starts to the same host
+HOST_MAX_CONCURRENCY = 2      # requests in flight per host
+HOST_BACKOFF_BASE = 2.0       # first backoff after a refusal, doubled per consecutive refusal
+HOST_BACKOFF_MAX = 60.0
+HOST_BACKOFF_STATUSES = {403, 429, 503}
+
+# Instrumentation: per-stage timings and counters, printed as a table and written as JSON
+QUIET = False                    # hide per-article progress lines (same as `python main.py --quiet`)
+METRICS_PATH = "run_metrics.json"
+
+# Near-duplicate article bodies (syndicated wire copy under different headlines) share one summary
+BODY_DEDUPE = True
+BODY_SIMHASH_DISTANCE = 6     # max differing bits (of 64); unrelated articles differ in ~32
+BODY_MIN_WORDS = 80           # shorter bodies are always summarized on their own
+
+# Relevance scoring (keywords.py): results scoring at or below MIN_RELEVANCE_SCORE are dropped
+# before any fetch or summarize work; TOP_K_RESULTS also caps how many of the best are kept
+MIN_RELEVANCE_SCORE = 1
+TOP_K_RESULTS = None
+
+# Search response cache: provider results are reused for a TTL per provider; once stale, Google News
+# RSS is revalidated with ETag / If-Modified-Since so an unchanged feed costs a 304 and no parsing
+SEARCH_CACHE_ENABLED = True
+SEARCH_CACHE_TTL_MINUTES = {"google": 30, "duckduckgo": 60}
+SEARCH_CACHE_KEEP_DAYS = 7       # stale entries are kept this long for conditional requests
+SEARCH_CACHE_MAX_MB = 20
+
+# HTML extraction in worker processes (extraction_pool.py): parsing is CPU-bound, so beyond a few
+# fetch threads it only scales across processes. None = one per CPU; 0 or 1 = extract in the fetch thread
+EXTRACTION_PROCESSES = None
+EXTRACTION_MAX_TASKS_PER_CHILD = 50   # pages per worker before it is replaced (caps lxml memory growth)
+
+# Title dedupe (dedupe.DedupeIndex): the default index gives exactly the linear scan's verdicts.
+# MinHash-LSH candidate generation is faster on very large result sets but can keep a near-duplicate
+TITLE_DEDUPE_LSH = False
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+
+# Fallbacks for strings that are neither RFC 822 nor ISO 8601
+EXTRA_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%d %b %Y",
+    "%d %B %Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+]
+
+
+@lru_cache(maxsize=8192)
+def parse_date(value: str):
+    """
+    Parse a feed date into a timezone-aware UTC datetime, or None if it cannot be parsed.
+    Handles RFC 822 (Google News RSS), ISO 8601 (DuckDuckGo) and a few plain formats.
+    Naive dates are taken as UTC. Results are cached per string.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+
+    dt = None
+    if value[:1].isalpha():
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            pass
+    if dt is None:
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    if dt is None:
+        for fmt in EXTRA_FORMATS:
+            try:
+                dt = datetime.strptime(value, fmt)
+                break
+            except ValueError:
+                continue
+    if dt is None:
+        return None
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def recent_flags(items: list, days: float, now: datetime = None) -> list:
+    """
+    For each item: True if its date is within the last `days`, False if older,
+    None if it has no parseable date.
+    """
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=days)
+    flags = []
+    for item in items:
+        dt = parse_date(item.get("date") or "")
+        flags.append(None if dt is None else dt >= cutoff)
+    return flags
@@ -0,0 +1,329 @@
+import hashlib
+import random
+import re
+from collections import Counter, defaultdict
+from itertools import chain
+from difflib import SequenceMatcher
+from urllib.parse import urlparse, urlunparse
+
+
+def normalize_url(url: str) -> str:
+    """Normalize URL for comparison (remove query params, fragments, trailing slashes)"""
+    try:
+        parsed = urlparse(url)
+        # Remove query params and fragments, normalize path
+        normalized = urlunparse((
+            parsed.scheme.lower(),
+            parsed.netloc.lower(),
+            parsed.path.rstrip('/'),
+            '', '', ''
+        ))
+        return normalized
+    except:
+        return url.lower().strip()
+
+
+def are_titles_similar(title1: str, title2: str, threshold: float = 0.90) -> bool:
+    """Check if two titles are similar using sequence matching"""
+    if not title1 or not title2:
+        return False
+
+    # Normalize titles
+    t1 = title1.lower().strip()
+    t2 = title2.lower().strip()
+
+    # Calculate similarity ratio
+    ratio = SequenceMatcher(None, t1, t2).ratio()
+    return ratio >= threshold
+
+
+def is_duplicate(new_item: dict, existing_items: list) -> bool:
+    """
+    Check if an article is a duplicate based on:
+    1. Exact URL match (after normalization)
+    2. Very similar title (>90% match)
+    Linear scan over existing_items; use DedupeIndex for large result sets.
+    """
+    new_url = normalize_url(new_item.get('link', ''))
+    new_title = new_item.get('title', '')
+
+    for existing in existing_items:
+        existing_url = normalize_url(existing.get('link', ''))
+        existing_title = existing.get('title', '')
+
+        # Check URL match
+        if new_url and existing_url and new_url == existing_url:
+            return True
+
+        # Check title similarity
+        if are_titles_similar(new_title, existing_title):
+            return True
+
+    return False
+
+
+# MinHash permutations (a * h + c) mod a Mersenne prime, fixed so signatures are stable across runs
+_MERSENNE = (1 << 61) - 1
+
+
+class DedupeIndex:
+    """
+    Incremental duplicate index giving the same verdicts as is_duplicate().
+
+    URLs go into a hash set. Titles go into a character q-gram inverted index whose
+    postings are split by normalized title length. Two titles with SequenceMatcher
+    ratio >= threshold have compatible lengths and are only a few character
+    insertions/deletions apart, so (q-gram lemma) they must share a minimum number of
+    q-grams. A probe only counts postings of compatible lengths, and only titles
+    reaching that bound get the exact are_titles_similar() check.
+
+    lsh=True swaps candidate generation for MinHash-LSH (`bands` bands of `rows`
+    values over the same q-grams): faster on very large result sets, but a similar
+    pair whose signatures share no band is never compared, so unlike the default it
+    can keep a duplicate. Candidates still get the exact check either way.
+    """
+
+    def __init__(self, threshold: float = 0.90, q: int = 3, lsh: bool = False, bands: int = 20, rows: int = 3):
+        self.threshold = threshold
+        self.q = q
+        self.lsh = lsh
+        self.bands = bands
+        self.rows = rows
+        self.urls = set()
+        self.titles = []                    # raw titles, by title id
+        self.lengths = []                   # normalized title length, by title id
+        self.gram_sets = []                 # frozenset of tagged q-grams, by title id
+        self.postings = defaultdict(dict)   # (q-gram, occurrence) -> {normalized length: title ids}
+        self.gram_counts = Counter()        # (q-gram, occurrence) -> titles containing it
+        self.buckets = defaultdict(list)    # lsh: (band, band values) -> title ids
+        self.unbanded = defaultdict(list)   # lsh: normalized length -> ids of titles without a signature
+        self.by_length = defaultdict(list)  # normalized length -> title ids
+        rng = random.Random(20240611)
+        self._perms = [(rng.randrange(1, _MERSENNE), rng.randrange(_MERSENNE)) for _ in range(bands * rows)]
+        self._gram_hashes = {}              # tagged q-gram -> its hash under every permutation
+        self._bounds = {}
+        self._last = None                   # (title, q-grams, band keys) of the last probe, reused by add()
+        self.exact_checks = 0
+
+    def __len__(self):
+        return len(self.titles)
+
+    def _grams(self, text: str) -> list:
+        """
+        Q-grams tagged with their occurrence number ("the", 0), ("the", 1), ...
+        so that counting matching tags counts shared q-grams with multiplicity.
+        """
+        q = self.q
+        seen = Counter()
+        grams = []
+        for i in range(len(text) - q + 1):
+            gram = text[i:i + q]
+            grams.append((gram, seen[gram]))
+            seen[gram] += 1
+        return grams
+
+    def _band_keys(self, grams: frozenset) -> list:
+        """LSH bucket keys of a q-gram set: its MinHash signature cut into bands"""
+        table = self._gram_hashes
+        columns = []
+        for gram in grams:
+            hashes = table.get(gram)
+            if hashes is None:
+                # The q-gram alphabet is small, so each distinct q-gram is hashed only once per index
+                h = int.from_bytes(hashlib.blake2b(f"{gram[0]}\0{gram[1]}".encode("utf-8"), digest_size=8).digest(), "big")
+                hashes = table[gram] = tuple((a * h + c) % _MERSENNE for a, c in self._perms)
+            columns.append(hashes)
+        signature = list(map(min, zip(*columns)))
+        rows = self.rows
+        return [(band, tuple(signature[band * rows:(band + 1) * rows])) for band in range(self.bands)]
+
+    def _length_range(self, la: int) -> range:
+        """Normalized title lengths that can reach the similarity threshold against length la"""
+        if la == 0:
+            return range(0, 1)
+        t = self.threshold
+        # ratio <= 2 * min(la, lb) / (la + lb)
+        lo = int(la * t / (2 - t) - 1e-9)
+        hi = int(la * (2 - t) / t + 1e-9)
+        return range(max(lo, 1), hi + 1)
+
+    def _min_shared(self, la: int, lb: int) -> int:
+        """Lower bound on shared q-grams (with multiplicity) for a pair that can be similar"""
+        q = self.q
+        # ratio = 2M / (la + lb) >= t leaves at most (1 - t) * (la + lb) unmatched chars,
+        # i.e. deletions from a plus insertions into a
+        max_edits = int((1 - self.threshold) * (la + lb) + 1e-6)
+        deletions = (max_edits + la - lb) // 2
+        insertions = (max_edits - la + lb) // 2
+        # A deletion breaks at most q q-grams, an insertion at most q - 1
+        from_a = la - q + 1 - q * deletions - (q - 1) * insertions
+        from_b = lb - q + 1 - q * insertions - (q - 1) * deletions
+        return max(from_a, from_b)
+
+    def _bound(self, la: int) -> int:
+        """Fewest shared q-grams a title of length la can have with any title it is similar to"""
+        bound = self._bounds.get(la)
+        if bound is None:
+            bound = self._bounds[la] = min(self._min_shared(la, lb) for lb in self._length_range(la))
+        return bound
+
+    def _features(self, norm: str) -> tuple:
+        """Q-gram set and LSH band keys (None unless lsh and long enough to filter) of a normalized title"""
+        if self._last is not None and self._last[0] == norm:
+            return self._last[1], self._last[2]
+        grams = frozenset(self._grams(norm))
+        keys = self._band_keys(grams) if self.lsh and self._bound(len(norm)) > 0 else None
+        self._last = (norm, grams, keys)
+        return grams, keys
+
+    def _candidates(self, norm: str) -> list:
+        la = len(norm)
+        lengths = self._length_range(la)
+        bound = self._bound(la)
+        grams, keys = self._features(norm)
+
+        if bound <= 0:
+            # Too short for the q-gram filter: compare against every title of a compatible length
+            return [tid for lb in lengths for tid in self.by_length.get(lb, ())]
+
+        if self.lsh:
+            probed = set(chain(
+                chain.from_iterable(self.unbanded.get(lb, ()) for lb in lengths),
+                chain.from_iterable(self.buckets.get(key, ()) for key in keys),
+            ))
+            min_count = 0
+        else:
+            # Skip the most common q-grams (their postings are the longest): a title sharing
+            # >= bound q-grams still shares >= bound - skip of the rest, which keeps this exact
+            counts = self.gram_counts
+            ordered = sorted(grams, key=lambda gram: counts.get(gram, 0))
+            skip = (bound - 1) // 2
+            postings = self.postings
+            probed = Counter(chain.from_iterable(
+                by_length[lb]
+                for by_length in (postings.get(gram) for gram in ordered[:len(ordered) - skip]) if by_length
+                for lb in lengths if lb in by_length
+            ))
+            min_count = bound - skip
+
+        candidates = []
+        for tid in sorted(probed):
+            if min_count and probed[tid] < min_count:
+                continue
+            lb = self.lengths[tid]
+            if lb in lengths and len(grams & self.gram_sets[tid]) >= self._min_shared(la, lb):
+                candidates.append(tid)
+        return candidates
+
+    def is_duplicate(self, item: dict) -> bool:
+        """Check an item against everything added so far"""
+        url = normalize_url(item.get('link', ''))
+        if url and url in self.urls:
+            return True
+
+        title = item.get('title', '')
+        if not title:
+            return False
+
+        for tid in self._candidates(title.lower().strip()):
+            self.exact_checks += 1
+            if are_titles_similar(title, self.titles[tid], self.threshold):
+                return True
+        return False
+
+    def add(self, item: dict):
+        """Index an item so later items are checked against it"""
+        url = normalize_url(item.get('link', ''))
+        if url:
+            self.urls.add(url)
+
+        title = item.get('title', '')
+        if not title:
+            return
+
+        tid = len(self.titles)
+        norm = title.lower().strip()
+        self.titles.append(title)
+        self.lengths.append(len(norm))
+        self.by_length[len(norm)].append(tid)
+        grams, keys = self._features(norm)
+        self.gram_sets.append(grams)
+        if self.lsh:
+            if keys is None:
+                self.unbanded[len(norm)].append(tid)
+            else:
+                for key in keys:
+                    self.buckets[key].append(tid)
+            return
+        self.gram_counts.update(grams)
+        for gram in grams:
+            self.postings[gram].setdefault(len(norm), []).append(tid)
+
+    def add_if_new(self, item: dict) -> bool:
+        """Add the item unless it duplicates an indexed one. Returns True if it was added."""
+        if self.is_duplicate(item):
+            return False
+        self.add(item)
+        return True
+
+
+def simhash(text: str, shingle: int = 3) -> int:
+    """
+    64-bit SimHash of a text's word shingles. Near-identical texts (the same wire story
+    with a different intro or footer) differ in only a few bits.
+    """
+    words = re.findall(r"\w+", text.lower())
+    if len(words) < shingle:
+        shingles = [" ".join(words)] if words else []
+    else:
+        shingles = [" ".join(words[i:i + shingle]) for i in range(len(words) - shingle + 1)]
+    if not shingles:
+        return 0
+
+    bits = [format(int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big"), "064b")
+            for s in shingles]
+    # Bit k of the fingerprint is set when most shingle hashes have it set
+    half = len(bits) / 2
+    return int("".join("1" if column.count("1") > half else "0" for column in zip(*bits)), 2)
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class SimHashIndex:
+    """
+    Fingerprints within max_distance bits of each other, found without a full scan.
+    The 64 bits are split into max_distance + 1 bands; two fingerprints that differ
+    in at most max_distance bits must agree exactly on at least one band.
+    """
+
+    def __init__(self, max_distance: int = 6):
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.width = 64 // self.bands
+        self.tables = [defaultdict(list) for _ in range(self.bands)]
+        self.entries = []  # (fingerprint, value)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _keys(self, fingerprint: int) -> list:
+        mask = (1 << self.width) - 1
+        return [(fingerprint >> (band * self.width)) & mask for band in range(self.bands)]
+
+    def add(self, fingerprint: int, value):
+        eid = len(self.entries)
+        self.entries.append((fingerprint, value))
+        for table, key in zip(self.tables, self._keys(fingerprint)):
+            table[key].append(eid)
+
+    def find(self, fingerprint: int):
+        """Value of the closest indexed fingerprint within max_distance bits, or None"""
+        best = None
+        for table, key in zip(self.tables, self._keys(fingerprint)):
+            for eid in table.get(key, ()):
+                distance = hamming(fingerprint, self.entries[eid][0])
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    best = (distance, eid)
+        return self.entries[best[1]][1] if best is not None else None
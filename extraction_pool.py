@@ -0,0 +1,92 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from html_extract import extract_from_html
+from metrics import metrics, log, set_quiet
+from config import EXTRACTION_PROCESSES, EXTRACTION_MAX_TASKS_PER_CHILD
+
+
+def _init_worker():
+    # Progress lines from worker processes would interleave with the main output
+    set_quiet(True)
+
+
+def _extract(html: bytes, url: str, encoding: str = None) -> tuple:
+    """
+    Runs in a worker process: raw HTML in, (text, extractor name, (timings, counters)) out.
+    The worker's own metrics (extract.* timers and error counters) go back with the text.
+    """
+    text, extractor_name = extract_from_html(html, url, encoding)
+    return text, extractor_name, metrics.drain()
+
+
+class ExtractionPool:
+    """
+    Runs HTML extraction (BeautifulSoup parsing, decompose, selector and paragraph scans)
+    in worker processes, so it is not serialized behind the GIL with the download threads.
+
+    Fetch threads call extract(html, url) and block until a worker returns the cleaned
+    text; only the HTML bytes, the text and the worker's extract.* metrics (merged into
+    the run metrics) cross the process boundary. Workers are
+    replaced after max_tasks_per_child pages so lxml / parser memory growth is returned
+    to the OS. The pool starts on first use, and with fewer than 2 processes pages are
+    extracted in the calling thread as before.
+    """
+
+    def __init__(self, processes: int = EXTRACTION_PROCESSES, max_tasks_per_child: int = EXTRACTION_MAX_TASKS_PER_CHILD):
+        self.processes = processes if processes is not None else (os.cpu_count() or 1)
+        self.max_tasks_per_child = max_tasks_per_child
+        self._lock = threading.Lock()
+        self._executor = None
+        self.pages = 0
+        self.fallbacks = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.processes >= 2
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that already runs fetch threads can copy held locks
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    max_tasks_per_child=self.max_tasks_per_child or None,
+                )
+            return self._executor
+
+    def extract(self, html: bytes, url: str, encoding: str = None) -> tuple:
+        """Extract one page. Returns (text, extractor name) or ("", None), like extract_from_html."""
+        if not self.enabled:
+            return extract_from_html(html, url, encoding)
+
+        try:
+            with metrics.timer("extract.process_pool"):
+                text, extractor_name, (timings, counters) = self._pool().submit(_extract, html, url, encoding).result()
+            metrics.merge(timings, counters)
+            with self._lock:
+                self.pages += 1
+            return text, extractor_name
+        except BrokenProcessPool as e:
+            # A worker died (e.g. killed for memory); extract here and start a fresh pool next time
+            metrics.count("extract.process_pool.broken")
+            log(f"   ⚠️ extraction worker died, extracting in-process: {str(e)[:80]}")
+            with self._lock:
+                self._executor = None
+                self.fallbacks += 1
+            return extract_from_html(html, url, encoding)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Shared by every fetch thread
+extraction_pool = ExtractionPool()
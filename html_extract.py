@@ -0,0 +1,224 @@
+import re
+from urllib.parse import urlparse
+
+import soupsieve
+from bs4 import BeautifulSoup
+from requests.compat import chardet
+
+from metrics import metrics, log
+
+# <meta charset="..."> / <meta http-equiv="Content-Type" content="...; charset=...">
+META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
+
+def decode_html(html: bytes, encoding: str = None) -> str:
+    """
+    Decode page bytes the way a browser would: the charset the server declared, else the
+    page's <meta> charset, else a detected one (what requests' apparent_encoding uses).
+    """
+    if not encoding:
+        match = META_CHARSET.search(html[:4096])
+        encoding = match.group(1).decode('ascii') if match else None
+    if not encoding:
+        encoding = chardet.detect(html)["encoding"]
+    try:
+        return html.decode(encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return html.decode('utf-8', errors='replace')
+
+
+def extract_with_soup(html: bytes, url: str, encoding: str = None) -> str:
+    """Extractor 1: BeautifulSoup with site-specific selectors and generic heuristics"""
+    soup = BeautifulSoup(html, 'lxml', from_encoding=encoding)
+
+    # Remove unwanted elements
+    for element in soup.find_all(['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'noscript']):
+        element.decompose()
+
+    text = extract_article_text(soup, url)
+    if text and len(text.strip()) > 100:
+        return text
+    return ""
+
+
+def extract_with_newspaper(html: bytes, url: str, encoding: str = None) -> str:
+    """Extractor 2: newspaper3k's parser run on the already downloaded HTML"""
+    from newspaper import Article  # heavy import, only paid once a page needs it
+
+    article = Article(url)
+    article.download(input_html=decode_html(html, encoding))
+    article.parse()
+
+    if article.text and len(article.text.strip()) > 100:
+        return article.text
+    return ""
+
+
+EXTRACTORS = [
+    ("soup", extract_with_soup),
+    ("newspaper3k", extract_with_newspaper),
+]
+
+
+def extract_from_html(html: bytes, url: str, encoding: str = None) -> tuple:
+    """Run every extractor over one downloaded page. Returns (text, extractor name) or ("", None)."""
+    for extractor_name, extractor in EXTRACTORS:
+        try:
+            with metrics.timer(f"extract.{extractor_name}"):
+                text = extractor(html, url, encoding)
+            if text:
+                return text, extractor_name
+        except Exception as e:
+            metrics.count(f"extract.{extractor_name}.errors")
+            log(f"   ⚠️ {extractor_name} extractor error: {str(e)[:80]}")
+    return "", None
+
+# Site-specific selectors, keyed by registered domain
+SELECTORS_MAP = {
+    'msn.com': [
+        'article',
+        'div[class*="article"]',
+        'div[class*="story"]',
+        'div[class*="content"]',
+        'main article',
+        'main div[class*="article"]',
+        '[data-t="article-body"]',
+        '.article-body',
+        '.articlebody',
+        'main .content',
+        'div[role="main"]',
+        'div[id*="article"]',
+        'div[id*="content"]',
+    ],
+    'abc.net.au': [
+        'article div[data-component="ArticleBody"]',
+        'article .article-content',
+        'article #body',
+        '.article__body',
+        'div[data-component="BodyText"]'
+    ],
+    'smh.com.au': ['article .article-body', '#article-body', 'article'],
+    'theage.com.au': ['article .article-body', 'article'],
+    'afr.com': ['article .article-content', 'article'],
+    'news.com.au': ['.story-primary', '.story-block', 'article'],
+    'theguardian.com': ['.article-body-commercial-selector', 'article'],
+    'bbc.com': ['.article__body-content', 'article'],
+    'reuters.com': ['.article-body__content', 'article'],
+    '9news.com.au': ['.article__body', 'article', '.story__body'],
+    '7news.com.au': ['.article-body', 'article'],
+}
+
+# Selectors compiled once at import time
+COMPILED_SELECTORS = {
+    domain: [soupsieve.compile(selector) for selector in selectors]
+    for domain, selectors in SELECTORS_MAP.items()
+}
+
+# Class keywords marking likely content containers
+CONTENT_CLASS_KEYWORDS = ('content', 'article', 'story', 'body', 'text', 'post')
+
+
+def selectors_for_domain(domain: str) -> list:
+    """
+    Compiled selectors for a host, matched on whole domain labels:
+    'www.abc.net.au' uses the 'abc.net.au' selectors but 'notmsn.com' does not use 'msn.com'.
+    """
+    labels = domain.lower().split(':')[0].split('.')
+    for i in range(len(labels)):
+        selectors = COMPILED_SELECTORS.get('.'.join(labels[i:]))
+        if selectors:
+            return selectors
+    return []
+
+
+def scan_document(soup: BeautifulSoup) -> tuple:
+    """
+    Single pass over the DOM.
+    Returns (candidates, paragraph_counts, paragraphs): candidate containers for each generic
+    strategy (article, main, content-class div/section, role=main div/section), the number of
+    descendant <p> tags per element (keyed by id), and every <p> in document order.
+    """
+    articles, mains, content_divs, role_mains = [], [], [], []
+    paragraph_counts = {}
+    paragraphs = []
+
+    for el in soup.descendants:
+        name = el.name
+        if name is None:
+            continue  # text node
+        if name == 'p':
+            paragraphs.append(el)
+            parent = el.parent
+            while parent is not None:
+                key = id(parent)
+                paragraph_counts[key] = paragraph_counts.get(key, 0) + 1
+                parent = parent.parent
+        elif name == 'article':
+            articles.append(el)
+        elif name == 'main':
+            mains.append(el)
+        elif name in ('div', 'section'):
+            classes = el.get('class')
+            if classes:
+                joined = (' '.join(classes) if isinstance(classes, list) else classes).lower()
+                if any(kw in joined for kw in CONTENT_CLASS_KEYWORDS):
+                    content_divs.append(el)
+            if el.get('role') == 'main':
+                role_mains.append(el)
+
+    return (articles, mains, content_divs, role_mains), paragraph_counts, paragraphs
+
+
+def extract_article_text(soup: BeautifulSoup, url: str) -> str:
+    """Extract text using multiple strategies"""
+    
+    domain = urlparse(url).netloc.lower()
+    
+    # Try domain-specific selectors
+    for selector in selectors_for_domain(domain):
+        elements = selector.select(soup)
+        if elements:
+            text = '\n\n'.join([el.get_text(strip=True, separator=' ') for el in elements])
+            if len(text) > 200:
+                return clean_text(text)
+    
+    # Generic strategies: article tag, main tag, content divs, role-based
+    candidates, paragraph_counts, all_paragraphs = scan_document(soup)
+    
+    for elements in candidates:
+        # Try to find the element with most paragraphs
+        best_element = None
+        max_paragraphs = 0
+        
+        for el in elements:
+            p_count = paragraph_counts.get(id(el), 0)
+            if p_count > max_paragraphs:
+                max_paragraphs = p_count
+                best_element = el
+        
+        if best_element and max_paragraphs >= 3:
+            paragraphs = best_element.find_all('p')
+            text = '\n\n'.join([p.get_text(strip=True) for p in paragraphs])
+            if len(text) > 200:
+                return clean_text(text)
+    
+    # Last resort: all paragraphs
+    if len(all_paragraphs) >= 5:
+        text = '\n\n'.join([p.get_text(strip=True) for p in all_paragraphs])
+        if len(text) > 200:
+            return clean_text(text)
+    
+    return ""
+
+def clean_text(text: str) -> str:
+    """Clean up extracted text"""
+    # Remove excessive whitespace
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    text = '\n\n'.join(lines)
+    
+    # Remove very short paragraphs (likely navigation/metadata)
+    paragraphs = text.split('\n\n')
+    paragraphs = [p for p in paragraphs if len(p) > 30]
+    
+    return '\n\n'.join(paragraphs)
+
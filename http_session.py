@@ -0,0 +1,111 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from config import HTTP_POOL_HOSTS, HTTP_POOL_MAXSIZE
+
+
+class _CountingPool:
+    """
+    Connection pool mixin that reports to a SessionManager as requests are sent and
+    connections opened, so the totals survive the pool manager evicting the pool.
+    """
+    manager = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.manager._add(pools=1)
+
+    def _new_conn(self):
+        self.manager._add(connections=1)
+        return super()._new_conn()
+
+    def _make_request(self, *args, **kwargs):
+        self.manager._add(requests=1)
+        return super()._make_request(*args, **kwargs)
+
+
+class SessionManager:
+    """
+    Process-wide HTTP sessions with keep-alive connection pools.
+
+    A single requests.Session is shared by all threads: its urllib3 pool manager keeps
+    one connection pool per host and is safe for concurrent use. Cloudscraper sessions
+    carry Cloudflare challenge state that is not safe to share, so each worker thread
+    gets its own scraper and reuses it (and its connections) for every URL it fetches.
+    """
+
+    def __init__(self, pool_hosts: int = HTTP_POOL_HOSTS, pool_maxsize: int = HTTP_POOL_MAXSIZE):
+        self.pool_hosts = pool_hosts
+        self.pool_maxsize = pool_maxsize
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._session = None
+        self._scrapers = []
+        self._counts = {"requests": 0, "connections": 0, "pools": 0}
+        self._pool_classes = {
+            "http": type("CountingHTTPConnectionPool", (_CountingPool, HTTPConnectionPool), {"manager": self}),
+            "https": type("CountingHTTPSConnectionPool", (_CountingPool, HTTPSConnectionPool), {"manager": self}),
+        }
+
+    def _add(self, **counts):
+        with self._lock:
+            for name, n in counts.items():
+                self._counts[name] += n
+
+    def _count(self, session):
+        # Pools are created lazily by each adapter's pool manager, so this covers every host
+        for adapter in session.adapters.values():
+            adapter.poolmanager.pool_classes_by_scheme = self._pool_classes
+        return session
+
+    def _mount(self, session: requests.Session) -> requests.Session:
+        for prefix in ("http://", "https://"):
+            session.mount(prefix, HTTPAdapter(
+                pool_connections=self.pool_hosts,
+                pool_maxsize=self.pool_maxsize,
+            ))
+        return self._count(session)
+
+    def session(self) -> requests.Session:
+        """Shared requests session"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._mount(requests.Session())
+        return self._session
+
+    def scraper(self):
+        """Cloudscraper session owned by the calling thread"""
+        scraper = getattr(self._local, "scraper", None)
+        if scraper is None:
+            import cloudscraper
+
+            # Keep cloudscraper's own TLS adapter; it already pools connections per host
+            scraper = cloudscraper.create_scraper(
+                browser={
+                    'browser': 'chrome',
+                    'platform': 'windows',
+                    'mobile': False
+                }
+            )
+            self._local.scraper = self._count(scraper)
+            with self._lock:
+                self._scrapers.append(scraper)
+        return scraper
+
+    def stats(self) -> dict:
+        """Requests sent vs. connections opened across every pooled session"""
+        with self._lock:
+            counts = dict(self._counts)
+
+        reused = max(counts["requests"] - counts["connections"], 0)
+        return {
+            "requests": counts["requests"],
+            "connections": counts["connections"],
+            "reused": reused,
+            "reuse_rate": reused / counts["requests"] if counts["requests"] else 0.0,
+            "pools": counts["pools"],
+        }
+
+sessions = SessionManager()
@@ -0,0 +1,132 @@
+import heapq
+import re
+from urllib.parse import urlparse
+
+from config import MIN_RELEVANCE_SCORE, TOP_K_RESULTS
+
+# Topic keywords and their weights; matched case-insensitively on whole words in the title
+KEYWORDS = {
+    # Digital health and AI
+    "artificial intelligence": 3.0, "ai": 2.5, "machine learning": 2.5, "generative ai": 3.0,
+    "digital health": 3.0, "healthtech": 2.5, "health tech": 2.5, "medtech": 2.0,
+    "telehealth": 2.5, "telemedicine": 2.5, "virtual care": 2.5, "virtual hospital": 2.5,
+    "remote patient monitoring": 2.5, "remote monitoring": 2.0, "wearable": 2.0, "wearables": 2.0,
+    "clinical decision support": 2.5, "electronic health record": 2.5, "electronic medical record": 2.5,
+    "my health record": 3.0, "ehr": 2.0, "emr": 2.0, "interoperability": 2.0, "health data": 2.0,
+    "diagnostics": 1.5, "medical device": 1.5, "medical devices": 1.5, "algorithm": 1.0,
+    "cybersecurity": 1.5, "data breach": 1.5, "privacy": 1.0, "startup": 1.0, "funding": 1.0,
+    "digital": 1.0, "app": 1.0, "software": 1.0, "platform": 0.5, "innovation": 1.0,
+    # Healthcare setting
+    "health": 1.0, "healthcare": 1.5, "hospital": 1.0, "hospitals": 1.0, "patient": 1.0, "patients": 1.0,
+    "clinician": 1.0, "clinicians": 1.0, "gp": 1.0, "aged care": 1.5, "mental health": 1.0, "medicare": 1.5,
+    # Australian context
+    "australia": 2.0, "australian": 2.0, "australians": 2.0, "aussie": 1.5,
+    "nsw": 1.5, "victoria": 1.0, "queensland": 1.0, "western australia": 1.5,
+    "south australia": 1.5, "tasmania": 1.0, "northern territory": 1.0,
+    "sydney": 1.0, "melbourne": 1.0, "brisbane": 1.0, "perth": 1.5, "adelaide": 1.0, "canberra": 1.0,
+    "tga": 2.0, "adha": 2.5, "australian digital health agency": 3.0, "csiro": 1.5,
+}
+
+# Publisher domains / names and their bonus; matched against the result's source and link
+DOMAINS = {
+    "abc.net.au": 2.0, "abc news": 2.0, "smh.com.au": 1.5, "sydney morning herald": 1.5,
+    "theage.com.au": 1.5, "the age": 1.5, "afr.com": 1.5, "financial review": 1.5,
+    "news.com.au": 1.0, "9news.com.au": 1.0, "theguardian.com/australia-news": 1.5,
+    "healthcareit.com.au": 2.5, "healthcare it news": 2.5, "pulseit.news": 2.5, "pulse+it": 2.5,
+    "itnews.com.au": 2.0, "itnews": 2.0, "mobihealthnews.com": 2.0, "mobihealthnews": 2.0,
+    "hospitalhealth.com.au": 2.0, "hospital + healthcare": 2.0, "medicalrepublic.com.au": 2.0,
+    "the medical republic": 2.0, "ausdoc.com.au": 2.0, "insightplus.mja.com.au": 2.0,
+    "health.gov.au": 2.0, "digitalhealth.gov.au": 2.5, ".gov.au": 1.5, ".com.au": 0.5, ".org.au": 0.5,
+}
+
+# Terms whose presence marks a story as off-topic (sport, celebrity, markets)
+PENALTIES = {
+    "afl": -2.0, "nrl": -2.0, "cricket": -2.0, "horoscope": -3.0, "celebrity": -2.0, "recipe": -2.0,
+    "asx": -1.0, "share price": -1.0,
+}
+
+
+WORD = re.compile(r"\w+")
+
+
+def _phrase(text: str) -> str:
+    """Lower-cased words joined by single spaces: the lookup key for titles and terms alike"""
+    return " ".join(WORD.findall(text.lower()))
+
+
+# Compiled once at import into word-phrase tables, so scoring a title is a handful of dict
+# lookups (longest phrase first at each word) instead of a regex search per keyword
+TITLE_WEIGHTS = {_phrase(term): weight for term, weight in {**KEYWORDS, **PENALTIES}.items()}
+TITLE_MAX_WORDS = max(len(term.split()) for term in TITLE_WEIGHTS)
+SOURCE_WEIGHTS = {_phrase(term): weight for term, weight in DOMAINS.items() if "." not in term}
+SOURCE_MAX_WORDS = max(len(term.split()) for term in SOURCE_WEIGHTS)
+HOST_WEIGHTS = {term: weight for term, weight in DOMAINS.items() if "." in term}
+
+
+def match_phrases(text: str, weights: dict, max_words: int) -> set:
+    """Distinct terms of `weights` in text; at each word the longest matching phrase wins"""
+    words = WORD.findall(text.lower())
+    matched = set()
+    i = 0
+    while i < len(words):
+        for n in range(min(max_words, len(words) - i), 0, -1):
+            phrase = " ".join(words[i:i + n]) if n > 1 else words[i]
+            if phrase in weights:
+                matched.add(phrase)
+                i += n
+                break
+        else:
+            i += 1
+    return matched
+
+
+def host_bonus(link: str) -> float:
+    """Best HOST_WEIGHTS entry matching the link's host (any suffix, e.g. ".gov.au") or host/section"""
+    parsed = urlparse(link)
+    labels = parsed.netloc.lower().split(".")
+    section = parsed.path.strip("/").split("/", 1)[0].lower()
+    best = None
+    for k in range(len(labels)):
+        suffix = ".".join(labels[k:])
+        for key in (suffix, "." + suffix, f"{suffix}/{section}"):
+            weight = HOST_WEIGHTS.get(key)
+            if weight is not None and (best is None or weight > best):
+                best = weight
+    return best
+
+
+def calculate_relevance_score(item: dict) -> float:
+    """
+    Relevance of a search result: each distinct keyword in the title counts once, plus
+    the best publisher bonus found in the source name or link.
+    """
+    score = sum(TITLE_WEIGHTS[term] for term in match_phrases(item.get("title") or "", TITLE_WEIGHTS, TITLE_MAX_WORDS))
+
+    bonuses = [SOURCE_WEIGHTS[term] for term in
+               match_phrases(item.get("source") or "", SOURCE_WEIGHTS, SOURCE_MAX_WORDS)]
+    host = host_bonus(item.get("link") or "")
+    if host is not None:
+        bonuses.append(host)
+    if bonuses:
+        score += max(bonuses)
+    return round(score, 2)
+
+
+def score_items(items: list, min_score: float = MIN_RELEVANCE_SCORE, top_k: int = TOP_K_RESULTS) -> list:
+    """
+    Score every item (sets item['relevance_score']) and return those scoring above
+    min_score, highest first. With top_k only the best top_k are kept, so nothing
+    below the cut is fetched or summarized. Ties keep their original order.
+    """
+    scored = []
+    for position, item in enumerate(items):
+        score = calculate_relevance_score(item)
+        item["relevance_score"] = score
+        if score > min_score:
+            scored.append((score, -position, item))
+
+    if top_k is not None and top_k < len(scored):
+        best = heapq.nlargest(top_k, scored, key=lambda entry: entry[:2])
+    else:
+        best = sorted(scored, key=lambda entry: entry[:2], reverse=True)
+    return [item for _, _, item in best]
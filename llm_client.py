@@ -0,0 +1,233 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from config import (
+    GROQ_API_KEY, GROQ_BASE_URL, GROQ_REQUESTS_PER_MINUTE, GROQ_TOKENS_PER_MINUTE,
+    LLM_CONCURRENCY, LLM_MAX_RETRIES, LLM_BACKOFF_BASE, LLM_BACKOFF_MAX,
+)
+from text_prep import estimate_tokens
+from metrics import metrics, log
+
+
+def retryable_errors() -> tuple:
+    """
+    Errors worth retrying: rate limits, server errors, timeouts and dropped connections.
+    The groq SDK is only imported once a request is actually made.
+    """
+    import groq
+    return (
+        groq.RateLimitError,
+        groq.InternalServerError,
+        groq.APITimeoutError,
+        groq.APIConnectionError,
+    )
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at rate_per_minute, holding at most capacity
+    (default: ten seconds' worth, so a cold start cannot spend the whole minute's budget at once).
+    reserve() always succeeds and returns how long the caller must wait before using the
+    tokens, so concurrent callers queue up fairly instead of polling.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(rate_per_minute / 6, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """Take amount tokens (going into debt if needed). Returns seconds to wait."""
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute budgets, shared by sync and async callers"""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+
+    def _reserve(self, tokens: int) -> float:
+        delay = max(self.requests.reserve(1), self.tokens.reserve(tokens))
+        if delay:
+            metrics.observe("llm.rate_limit_wait", delay)
+        return delay
+
+    def acquire(self, tokens: int):
+        delay = self._reserve(tokens)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: int):
+        delay = self._reserve(tokens)
+        if delay:
+            await asyncio.sleep(delay)
+
+
+def retry_after_seconds(error: Exception):
+    """Seconds from a Retry-After header on an API error (delta-seconds or HTTP date), if present"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, error: Exception = None,
+                  base: float = LLM_BACKOFF_BASE, cap: float = LLM_BACKOFF_MAX) -> float:
+    """Retry-After when the server sent one, otherwise full-jitter exponential backoff"""
+    retry_after = retry_after_seconds(error) if error is not None else None
+    if retry_after is not None:
+        return min(retry_after, cap) + random.uniform(0, base)
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def record_usage(chat, latency: float):
+    """Request latency and token usage reported by the API"""
+    metrics.observe("llm.request", latency)
+    usage = getattr(chat, "usage", None)
+    if usage is not None:
+        metrics.count("llm.prompt_tokens", getattr(usage, "prompt_tokens", 0) or 0)
+        metrics.count("llm.completion_tokens", getattr(usage, "completion_tokens", 0) or 0)
+
+
+class LLMClient:
+    """
+    Groq chat-completion client with rate limiting and retries.
+
+    complete() is blocking (for worker threads); acomplete() is the asyncio version and
+    additionally caps in-flight requests at `concurrency`. Both draw from the same
+    RateLimiter. base_url can point at a local fake server for tests and benchmarks.
+    """
+
+    def __init__(self, api_key: str = GROQ_API_KEY, base_url: str = GROQ_BASE_URL,
+                 requests_per_minute: float = GROQ_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: float = GROQ_TOKENS_PER_MINUTE,
+                 concurrency: int = LLM_CONCURRENCY, max_retries: int = LLM_MAX_RETRIES):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self._client = None
+        self._async_clients = {}
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        """groq.Groq client, built on first use (so imports and non-LLM commands need no API key)"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import groq
+
+                    # Retries are handled here so rate limits and backoff stay in one place
+                    self._client = groq.Groq(api_key=self.api_key, base_url=self.base_url, max_retries=0)
+        return self._client
+
+    def _async_state(self):
+        """AsyncGroq client and concurrency semaphore for the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop not in self._async_clients:
+                import groq
+
+                self._async_clients[loop] = groq.AsyncGroq(
+                    api_key=self.api_key, base_url=self.base_url, max_retries=0
+                )
+                self._semaphores[loop] = asyncio.Semaphore(self.concurrency)
+            return self._async_clients[loop], self._semaphores[loop]
+
+    def complete(self, prompt: str, model: str, temperature: float, max_tokens: int) -> str:
+        """Blocking chat completion. Raises the last error once retries are exhausted."""
+        cost = estimate_tokens(prompt) + max_tokens
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(cost)
+            start = time.perf_counter()
+            try:
+                chat = self.client.chat.completions.create(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+                record_usage(chat, time.perf_counter() - start)
+                return (chat.choices[0].message.content or "").strip()
+            except retryable_errors() as e:
+                metrics.count(f"llm.errors.{type(e).__name__}")
+                if attempt == self.max_retries:
+                    raise
+                delay = backoff_delay(attempt, e)
+                metrics.count("llm.retries")
+                log(f"   ⏳ LLM {type(e).__name__}, retrying in {delay:.1f}s "
+                      f"({attempt + 1}/{self.max_retries})")
+                time.sleep(delay)
+
+    async def acomplete(self, prompt: str, model: str, temperature: float, max_tokens: int) -> str:
+        """Async chat completion. Raises the last error once retries are exhausted."""
+        client, semaphore = self._async_state()
+        cost = estimate_tokens(prompt) + max_tokens
+        for attempt in range(self.max_retries + 1):
+            error = None
+            async with semaphore:
+                await self.limiter.acquire_async(cost)
+                start = time.perf_counter()
+                try:
+                    chat = await client.chat.completions.create(
+                        model=model,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+                    record_usage(chat, time.perf_counter() - start)
+                    return (chat.choices[0].message.content or "").strip()
+                except retryable_errors() as e:
+                    metrics.count(f"llm.errors.{type(e).__name__}")
+                    if attempt == self.max_retries:
+                        raise
+                    error = e
+                    delay = backoff_delay(attempt, e)
+            # Back off outside the semaphore so other requests can use the slot
+            metrics.count("llm.retries")
+            log(f"   ⏳ LLM {type(error).__name__}, retrying in {delay:.1f}s "
+                  f"({attempt + 1}/{self.max_retries})")
+            await asyncio.sleep(delay)
+
+
+class BackgroundLoop:
+    """An asyncio event loop on a daemon thread, so worker threads can submit coroutines"""
+
+    def __init__(self):
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def submit(self, coro):
+        """Schedule a coroutine; returns a concurrent.futures.Future"""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="llm-loop", daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
@@ -1,66 +1,621 @@
+# Stage modules (search, article_fetcher, summarizer, report_writers, http_session) pull in
+# requests, newspaper3k, cloudscraper, lxml, groq and python-docx; they are imported inside
+# the functions that need them so each CLI command only loads its own stage.
+from state_store import StateStore
+from checkpoint import Checkpoint
+from politeness import host_scheduler, interleave_by_host
+from metrics import metrics, log, set_quiet
+from text_prep import token_savings
+from summary_reuse import SummaryReuse, done_future
+from config import (
+    PIPELINE_MODE, FETCH_WORKERS, SUMMARIZE_WORKERS, SUMMARY_BATCH_MODE, LLM_ASYNC, LLM_CONCURRENCY,
+    INCREMENTAL_MODE, MERGE_PREVIOUS_SUMMARIES, STATE_DB_PATH, STATE_RETENTION_DAYS, CHECKPOINT_PATH,
+    REPORT_FORMATS, QUIET, METRICS_PATH, BODY_DEDUPE, GROQ_API_KEY, GROQ_BASE_URL,
+)
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import argparse
+import json
+import os
+import sys
+import threading
 
-from search import search_news
-from article_fetcher import fetch_article_text
-from summarizer import summarize
-from storage import save_doc
-import time
+# Articles processed by earlier runs (incremental mode); opened by main() so single-stage
+# commands never touch it
+state_store = None
 
-def main():
-    print("=" * 60)
-    print("🔍 Digital Health News Aggregator")
-    print("=" * 60)
-    
-    print("\n🔎 Searching for news...")
-    results = search_news()
-    
-    if not results:
-        print("❌ No results found. Exiting.")
-        return
 
-    print(f"\n📰 Processing {len(results)} articles...\n")
-    
+def summarize_article(text: str) -> tuple:
+    """
+    Summarize fetched article text.
+    Returns (summary, ok) where ok tells whether a usable summary was produced.
+    """
+    if not text:
+        return "Summary not available - could not fetch article content.", False
+
+    from summarizer import summarize
+
+    with metrics.timer("summarize.article"):
+        summary = summarize(text)
+
+    # Check if summarization was successful
+    return summary, "not available" not in summary.lower()
+
+
+async def summarize_article_async(text: str) -> tuple:
+    """summarize_article() on the asyncio Groq client"""
+    if not text:
+        return "Summary not available - could not fetch article content.", False
+
+    from summarizer import summarize_async
+
+    with metrics.timer("summarize.article"):
+        summary = await summarize_async(text)
+    return summary, "not available" not in summary.lower()
+
+
+def build_record(item: dict, summary: str, same_as: str = None) -> dict:
+    """Build the output record for a search result and its summary"""
+    record = {
+        "Title": item["title"],
+        "Summary": summary,
+        "Link": item["link"],
+        "Date": item["date"]
+    }
+    if same_as:
+        # Near-duplicate body: the summary is the one written for this link
+        record["Same story as"] = same_as
+    return record
+
+
+def same_as(reuse: SummaryReuse, i: int):
+    """Link whose summary results[i] reused, if any"""
+    return reuse.same_as.get(i) if reuse is not None else None
+
+
+def summary_result(future) -> tuple:
+    """(summary, ok) from a finished summarize_article future"""
+    try:
+        return future.result()
+    except Exception as e:
+        return f"Summary not available - API error: {str(e)}", False
+
+
+def process_sequential(results: list, on_record=None, reuse: SummaryReuse = None) -> tuple:
+    """
+    Fetch and summarize articles one at a time. Returns (data, successful, failed).
+    on_record(index, record) is called as soon as each article is done.
+    With reuse, near-duplicate bodies share one summary (see SummaryReuse).
+    """
+    from article_fetcher import fetch_article_text
+
     data = []
     successful = 0
     failed = 0
-    
+
     for i, item in enumerate(results, 1):
-        print(f"[{i}/{len(results)}] {item['title'][:60]}...")
-        
+        log(f"[{i}/{len(results)}] {item['title'][:60]}...")
+
         # Fetch article content
         text = fetch_article_text(item["link"])
-        
+
         # Generate summary
         if text:
-            print(f"   → Generating summary...")
-            summary = summarize(text)
-            
-            # Check if summarization was successful
-            if "not available" not in summary.lower():
+            log(f"   → Generating summary...")
+        if reuse is not None:
+            future = reuse.summary_future(i - 1, item["link"], text, lambda text: done_future(summarize_article(text)))
+            summary, ok = summary_result(future)
+        else:
+            summary, ok = summarize_article(text)
+
+        if ok:
+            successful += 1
+        else:
+            failed += 1
+
+        data.append(build_record(item, summary, same_as(reuse, i - 1)))
+        if on_record is not None:
+            on_record(i - 1, data[-1])
+
+        # Per-host pacing happens in the fetcher (politeness.host_scheduler)
+        log("")
+
+    return data, successful, failed
+
+
+def process_pipelined(results: list,
+                      fetch_workers: int = FETCH_WORKERS,
+                      summarize_workers: int = SUMMARIZE_WORKERS,
+                      use_async: bool = LLM_ASYNC,
+                      on_record=None,
+                      reuse: SummaryReuse = None) -> tuple:
+    """
+    Fetch and summarize articles concurrently.
+    The fetch stage and the summarize stage each have their own bounded worker pool;
+    an article is handed to the summarize stage as soon as its fetch completes.
+    With use_async the summarize stage is the asyncio Groq client (LLM_CONCURRENCY
+    requests in flight, paced by the rate limiter) instead of a thread pool.
+    Records are returned in the original (relevance) order. Returns (data, successful, failed).
+    on_record(index, record) is called as soon as each article is done, in completion order,
+    on a single writer thread (never on the event loop or a summarize worker). If it raises,
+    later records are not written and the exception is re-raised once the run finishes.
+    """
+    from article_fetcher import fetch_article_text
+
+    total = len(results)
+    summary_futures = {}
+    recorded = []
+    write_errors = []
+
+    def completed(i, future, event):
+        try:
+            if not write_errors:
+                on_record(i, build_record(results[i], summary_result(future)[0], same_as(reuse, i)))
+        except Exception as e:
+            write_errors.append(e)
+        finally:
+            event.set()
+
+    loop = None
+    if use_async:
+        from llm_client import BackgroundLoop
+        loop = BackgroundLoop()
+
+    # Checkpoint fsyncs, state store commits and report writes happen on the writer thread,
+    # so they never stall the asyncio loop (every in-flight Groq request) or a summarize worker
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="record-writer") as writer_pool, \
+         ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool, \
+         ThreadPoolExecutor(max_workers=summarize_workers) as summarize_pool:
+
+        # Round-robin across hosts so workers are not all waiting on the same site
+        fetch_futures = {
+            fetch_pool.submit(fetch_article_text, results[i]["link"]): i
+            for i in interleave_by_host([item["link"] for item in results])
+        }
+
+        for future in as_completed(fetch_futures):
+            i = fetch_futures[future]
+            try:
+                text = future.result()
+            except Exception as e:
+                log(f"   ❌ Fetch error: {str(e)[:80]}")
+                text = ""
+
+            log(f"[{i + 1}/{total}] {results[i]['title'][:60]}...")
+            if text:
+                log(f"   → Generating summary...")
+            if loop is not None:
+                submit = lambda text: loop.submit(summarize_article_async(text))
+            else:
+                submit = lambda text: summarize_pool.submit(summarize_article, text)
+            if reuse is not None:
+                summary_futures[i] = reuse.summary_future(i, results[i]["link"], text, submit)
+            else:
+                summary_futures[i] = submit(text)
+            if on_record is not None:
+                event = threading.Event()
+                recorded.append(event)
+                summary_futures[i].add_done_callback(
+                    lambda future, i=i, event=event: writer_pool.submit(completed, i, future, event)
+                )
+
+        data = []
+        successful = 0
+        failed = 0
+
+        for i, item in enumerate(results):
+            summary, ok = summary_result(summary_futures[i])
+
+            if ok:
                 successful += 1
             else:
                 failed += 1
+
+            data.append(build_record(item, summary, same_as(reuse, i)))
+
+        # Done-callbacks may still be queueing records; wait for all of them before the writer stops
+        for event in recorded:
+            event.wait()
+
+    if write_errors:
+        raise write_errors[0]
+    return data, successful, failed
+
+
+def process_batched(results: list,
+                    fetch_workers: int = FETCH_WORKERS,
+                    summarize_workers: int = SUMMARIZE_WORKERS,
+                    on_record=None,
+                    reuse: SummaryReuse = None) -> tuple:
+    """
+    Fetch all articles concurrently, then summarize them with batched requests
+    (several short articles per Groq call). Returns (data, successful, failed).
+    on_record(index, record) is called for each article once the summaries are in.
+    """
+    from article_fetcher import fetch_article_text
+    from summarizer import summarize_batch
+
+    total = len(results)
+    texts = [""] * total
+
+    with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool:
+        fetch_futures = {
+            fetch_pool.submit(fetch_article_text, results[i]["link"]): i
+            for i in interleave_by_host([item["link"] for item in results])
+        }
+        for future in as_completed(fetch_futures):
+            i = fetch_futures[future]
+            try:
+                texts[i] = future.result()
+            except Exception as e:
+                log(f"   ❌ Fetch error: {str(e)[:80]}")
+            log(f"[{i + 1}/{total}] {results[i]['title'][:60]}...")
+
+    fetched = [i for i, text in enumerate(texts) if text]
+    reused = {}
+    if reuse is not None:
+        # Only the first article of each near-duplicate group goes into the batches
+        originals = {}
+        for i in fetched:
+            future = reuse.summary_future(i, results[i]["link"], texts[i], lambda text: Future(),
+                                          retry=lambda text: done_future(summarize_article(text)))
+            if i in reuse.same_as:
+                reused[i] = future
+            else:
+                originals[i] = future
+        fetched = [i for i in fetched if i not in reused]
+
+    log(f"\n   → Generating summaries for {len(fetched)} articles...")
+    summaries = summarize_batch([texts[i] for i in fetched], workers=summarize_workers)
+    summary_by_index = dict(zip(fetched, summaries))
+    if reuse is not None:
+        for i, future in originals.items():
+            future.set_result((summary_by_index[i], "not available" not in summary_by_index[i].lower()))
+        summary_by_index.update({i: summary_result(future)[0] for i, future in reused.items()})
+
+    data = []
+    successful = 0
+    failed = 0
+    for i, item in enumerate(results):
+        if i in summary_by_index:
+            summary = summary_by_index[i]
+            ok = "not available" not in summary.lower()
+        else:
+            summary, ok = summarize_article("")
+
+        if ok:
+            successful += 1
         else:
-            summary = "Summary not available - could not fetch article content."
             failed += 1
 
-        data.append({
-            "Title": item["title"],
-            "Summary": summary,
-            "Link": item["link"],
-            "Date": item["date"]
-        })
-        
-        # Small delay between articles
-        time.sleep(1)
-        print()
+        data.append(build_record(item, summary, same_as(reuse, i)))
+        if on_record is not None:
+            on_record(i, data[-1])
+
+    return data, successful, failed
+
+
+def print_cache_stats(name: str, cache):
+    """Print hit/miss counters for a persistent cache (if enabled)"""
+    if cache is None:
+        return
+    stats = cache.stats()
+    print(f"💾 {name}: {stats['hits']} hits, {stats['misses']} misses "
+          f"({stats['entries']} entries, {stats['bytes'] / 1024 / 1024:.1f} MB)")
+
+
+def process_results(results: list, on_record=None, reuse: SummaryReuse = None) -> tuple:
+    """Run the configured processing mode over search results. Returns (data, successful, failed)."""
+    if not results:
+        return [], 0, 0
+
+    if SUMMARY_BATCH_MODE:
+        print(f"📦 Batched summarization mode: {FETCH_WORKERS} fetch workers, {SUMMARIZE_WORKERS} summarize workers\n")
+        return process_batched(results, on_record=on_record, reuse=reuse)
+    if PIPELINE_MODE:
+        summarizers = f"async summarizer ({LLM_CONCURRENCY} in flight)" if LLM_ASYNC else f"{SUMMARIZE_WORKERS} summarize workers"
+        print(f"⚡ Pipelined mode: {FETCH_WORKERS} fetch workers, {summarizers}\n")
+        return process_pipelined(results, on_record=on_record, reuse=reuse)
+    return process_sequential(results, on_record=on_record, reuse=reuse)
+
+
+def record_cache_metrics(name: str, cache):
+    """Copy a persistent cache's hit/miss counters into the run metrics"""
+    if cache is None:
+        return
+    stats = cache.stats()
+    metrics.count(f"cache.{name}.hits", stats["hits"])
+    metrics.count(f"cache.{name}.misses", stats["misses"])
+
+
+def main(resume: bool = False, checkpoint_path: str = CHECKPOINT_PATH,
+         quiet: bool = QUIET, metrics_path: str = METRICS_PATH):
+    from search import search_news
+    from article_fetcher import article_cache, strategy_stats
+    from summarizer import summary_cache
+    from report_writers import ReportStream
+    from http_session import sessions
+    from extraction_pool import extraction_pool
+
+    global state_store
+    if INCREMENTAL_MODE and state_store is None:
+        state_store = StateStore(STATE_DB_PATH, retention_days=STATE_RETENTION_DAYS)
+
+    set_quiet(quiet)
+    print("=" * 60)
+    print("🔍 Digital Health News Aggregator")
+    print("=" * 60)
+
+    checkpoint = Checkpoint(checkpoint_path)
+
+    if resume:
+        if not os.path.exists(checkpoint_path):
+            print(f"❌ No checkpoint found at {checkpoint_path}. Exiting.")
+            return
+        all_results, records, skip = checkpoint.resume()
+        print(f"\n♻️ Resuming from {checkpoint_path}: {len(records)} of "
+              f"{len(all_results) - len(skip)} articles already done")
+    else:
+        print("\n🔎 Searching for news...")
+        with metrics.timer("stage.search"):
+            all_results = search_news()
+
+        if not all_results:
+            print("❌ No results found. Exiting.")
+            return
+
+        records = {}
+        skip = set()
+        if state_store is not None:
+            new_results, previous = state_store.partition(all_results)
+            print(f"\n🗂️ Incremental mode: {len(new_results)} new, {len(previous)} processed by earlier runs")
+            if MERGE_PREVIOUS_SUMMARIES:
+                # Stored summaries go straight into the report
+                records = {i: build_record(all_results[i], row["summary"]) for i, row in previous.items()}
+            else:
+                skip = set(previous)
+
+        checkpoint.start(all_results, skip)
+        for i, record in records.items():
+            checkpoint.append(i, record)
+
+    pending = [i for i in range(len(all_results)) if i not in records and i not in skip]
+    results = [all_results[i] for i in pending]
+
+    # Report files are written as records finish (in relevance order), not all at the end
+    order = [i for i in range(len(all_results)) if i not in skip]
+    report = ReportStream(REPORT_FORMATS, order) if order else None
+    for i in sorted(records):
+        report.add(i, records[i])
+
+    reuse = None
+    if BODY_DEDUPE:
+        reuse = SummaryReuse(state_store.body_fingerprints() if state_store is not None else ())
+
+    def on_record(j, record):
+        i = pending[j]
+        records[i] = record
+        checkpoint.append(i, record)
+        report.add(i, record)
+        # Failed articles are not remembered, so the next run retries them
+        if state_store is not None and "not available" not in record["Summary"].lower():
+            body_hash = reuse.fingerprints.get(j) if reuse is not None else None
+            state_store.record(all_results[i], record["Summary"], body_hash=body_hash)
+
+    print(f"\n📰 Processing {len(results)} articles...\n")
+    with metrics.timer("stage.process"):
+        _, successful, failed = process_results(results, on_record=on_record, reuse=reuse)
+    checkpoint.close()
+    extraction_pool.shutdown()
 
     # Save results
     print("=" * 60)
     print(f"✅ Successfully processed: {successful}")
     print(f"⚠️ Failed to process: {failed}")
+    print_cache_stats("Article cache", article_cache)
+    print_cache_stats("Summary cache", summary_cache)
+    savings = token_savings.stats()
+    if savings["articles"]:
+        print(f"✂️ Summarizer input: {savings['tokens_in']} → {savings['tokens_out']} tokens for "
+              f"{savings['articles']} articles ({savings['saved_vs_fixed_cut']} saved vs. the 8000-char cut, "
+              f"{savings['saved_rate']:.0%})")
+    http_stats = sessions.stats()
+    print(f"🔌 HTTP: {http_stats['requests']} requests over {http_stats['connections']} connections "
+          f"({http_stats['reused']} reused, {http_stats['reuse_rate']:.0%})")
+    polite = host_scheduler.stats()
+    print(f"🚦 Hosts: {polite['hosts']} paced, {polite['waited']:.1f}s spent waiting, {polite['backoffs']} backoffs")
+    if extraction_pool.enabled:
+        print(f"🧵 Extraction: {extraction_pool.pages} pages parsed in {extraction_pool.processes} worker processes")
+    if reuse is not None:
+        reuse.print_report()
     print("=" * 60)
-    
-    save_doc(data)
+
+    strategy_stats.save()
+    strategy_stats.print_report()
+
+    if report is None:
+        print("\nℹ️ No new articles since the last run. Nothing to save.")
+    else:
+        with metrics.timer("stage.report"):
+            report.close()
+        print(f"🕐 All times shown in AWST (Australian Western Standard Time)")
+
+    record_cache_metrics("article", article_cache)
+    record_cache_metrics("summary", summary_cache)
+    metrics.count("articles.successful", successful)
+    metrics.count("articles.failed", failed)
+    metrics.print_summary()
+    if metrics_path:
+        metrics.write_json(metrics_path)
+        print(f"📊 Metrics written to {metrics_path}")
+
+
+
+def read_jsonl(path: str) -> list:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def write_jsonl(path: str, rows: list):
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def search_only(output: str = None) -> list:
+    """Run the searches and print the ranked results; nothing is fetched or summarized"""
+    from search import search_news
+
+    results = search_news()
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=1)
+        print(f"💾 Saved {len(results)} results to {output}")
+    return results
+
+
+def fetch_only(input_path: str, output: str, limit: int = None) -> list:
+    """Fetch article text for saved search results. Writes one JSON line per result (result + "text")."""
+    from article_fetcher import fetch_article_text, strategy_stats
+    from extraction_pool import extraction_pool
+
+    with open(input_path, encoding="utf-8") as f:
+        results = json.load(f)[:limit]
+    print(f"📰 Fetching {len(results)} articles ({FETCH_WORKERS} workers)...")
+
+    texts = [""] * len(results)
+    with metrics.timer("stage.fetch"), ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        futures = {
+            pool.submit(fetch_article_text, results[i]["link"]): i
+            for i in interleave_by_host([item["link"] for item in results])
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                texts[i] = future.result()
+            except Exception as e:
+                log(f"   ❌ Fetch error: {str(e)[:80]}")
+            log(f"[{i + 1}/{len(results)}] {results[i]['title'][:60]}... {'✅' if texts[i] else '❌'}")
+    extraction_pool.shutdown()
+
+    strategy_stats.save()
+    rows = [dict(item, text=text) for item, text in zip(results, texts)]
+    write_jsonl(output, rows)
+    print(f"💾 Saved {sum(1 for text in texts if text)}/{len(rows)} article texts to {output}")
+    return rows
+
+
+def summarize_only(input_path: str, output: str) -> list:
+    """Summarize fetched articles (from fetch_only). Writes report records as JSON lines."""
+    rows = read_jsonl(input_path)
+    reuse = SummaryReuse() if BODY_DEDUPE else None
+    print(f"🤖 Summarizing {sum(1 for row in rows if row.get('text'))} articles...")
+
+    with metrics.timer("stage.summarize"), ThreadPoolExecutor(max_workers=SUMMARIZE_WORKERS) as pool:
+        submit = lambda text: pool.submit(summarize_article, text)
+        futures = [
+            reuse.summary_future(i, row["link"], row.get("text", ""), submit) if reuse is not None
+            else submit(row.get("text", ""))
+            for i, row in enumerate(rows)
+        ]
+        records = [build_record(row, summary_result(future)[0], same_as(reuse, i))
+                   for i, (row, future) in enumerate(zip(rows, futures))]
+
+    if reuse is not None:
+        reuse.print_report()
+    write_jsonl(output, records)
+    ok = sum(1 for record in records if "not available" not in record["Summary"].lower())
+    print(f"💾 Saved {ok}/{len(records)} summaries to {output}")
+    return records
+
+
+def report_only(input_path: str, formats: list) -> list:
+    """Write report files from summarized records (summarize output, a JSONL report or a run checkpoint)"""
+    from report_writers import ReportStream
+
+    rows = read_jsonl(input_path)
+    if rows and rows[0].get("type") == "run":
+        # Checkpoint lines are in completion order; place each record by its result index
+        all_results, records, skip = Checkpoint.load(input_path)
+        order = [i for i in range(len(all_results)) if i not in skip]
+        records = {i: record for i, record in records.items() if i not in skip}
+    else:
+        records = dict(enumerate(row for row in rows if "Summary" in row))
+        order = sorted(records)
+    report = ReportStream(formats, order)
+    for i in sorted(records):
+        report.add(i, records[i])
+    return report.close()
+
+
+def cli(argv: list = None):
+    """Command line entry point: `run` (default) or a single stage"""
+    def option_parsers(top_level: bool) -> tuple:
+        """
+        Options accepted both before and after the command. The subcommand copies default
+        to SUPPRESS, so `--quiet search` is not reset by the search subparser's default.
+        """
+        default = (lambda value: value) if top_level else (lambda value: argparse.SUPPRESS)
+        common = argparse.ArgumentParser(add_help=False)
+        common.add_argument("--quiet", action="store_true", default=default(QUIET),
+                            help="hide per-article progress output")
+
+        run_options = argparse.ArgumentParser(add_help=False)
+        run_options.add_argument("--resume", action="store_true", default=default(False),
+                                 help="continue an interrupted run from its checkpoint instead of searching again")
+        run_options.add_argument("--checkpoint", default=default(CHECKPOINT_PATH),
+                                 help=f"checkpoint file (default: {CHECKPOINT_PATH})")
+        run_options.add_argument("--metrics", default=default(METRICS_PATH),
+                                 help=f"write run metrics JSON here (default: {METRICS_PATH})")
+        return common, run_options
+
+    top_common, top_run_options = option_parsers(top_level=True)
+    common, run_options = option_parsers(top_level=False)
+
+    parser = argparse.ArgumentParser(description="Digital Health News Aggregator", parents=[top_common, top_run_options])
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    commands.add_parser("run", parents=[common, run_options], help="search, fetch, summarize and report (default)")
+
+    search = commands.add_parser("search", parents=[common], help="search and rank only (no fetching, no API key)")
+    search.add_argument("-o", "--output", default="search_results.json", help="default: %(default)s")
+
+    fetch = commands.add_parser("fetch", parents=[common], help="fetch article text for saved search results")
+    fetch.add_argument("-i", "--input", default="search_results.json", help="default: %(default)s")
+    fetch.add_argument("-o", "--output", default="fetched_articles.jsonl", help="default: %(default)s")
+    fetch.add_argument("--limit", type=int, default=None, help="only the N most relevant results")
+
+    summarize = commands.add_parser("summarize", parents=[common], help="summarize fetched articles")
+    summarize.add_argument("-i", "--input", default="fetched_articles.jsonl", help="default: %(default)s")
+    summarize.add_argument("-o", "--output", default="summaries.jsonl", help="default: %(default)s")
+
+    report = commands.add_parser("report", parents=[common], help="write report files from summaries")
+    report.add_argument("-i", "--input", default="summaries.jsonl",
+                        help="summaries, a .jsonl report or a run checkpoint (default: %(default)s)")
+    report.add_argument("--formats", nargs="+", default=REPORT_FORMATS, help="default: %(default)s")
+
+    args = parser.parse_args(argv)
+    set_quiet(args.quiet)
+    command = args.command or "run"
+
+    if command in ("run", "summarize") and not (GROQ_API_KEY or GROQ_BASE_URL):
+        print("❌ GROQ_API_KEY is not set (see .env). The search, fetch and report commands work without it.")
+        sys.exit(1)
+
+    if command == "run":
+        main(resume=args.resume, checkpoint_path=args.checkpoint, quiet=args.quiet, metrics_path=args.metrics)
+        return
+
+    if getattr(args, "input", None) and not os.path.exists(args.input):
+        print(f"❌ Input file not found: {args.input}")
+        sys.exit(1)
+    if command == "search":
+        search_only(args.output)
+    elif command == "fetch":
+        fetch_only(args.input, args.output, args.limit)
+    elif command == "summarize":
+        summarize_only(args.input, args.output)
+    elif command == "report":
+        report_only(args.input, args.formats)
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    cli()
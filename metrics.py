@@ -0,0 +1,120 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from config import QUIET
+
+
+class Metrics:
+    """
+    Run-wide counters and timings, safe to update from any thread.
+
+    timer(name) / observe(name, seconds) collect durations (count, total, mean, p50,
+    p95, max); count(name, n) accumulates plain totals such as bytes, tokens or
+    cache hits. Names are dotted, e.g. "fetch.strategy.requests" or "llm.prompt_tokens".
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.timings = {}
+        self.counters = {}
+        self.started = time.time()
+
+    @contextmanager
+    def timer(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            self.timings.setdefault(name, []).append(seconds)
+
+    def count(self, name: str, n: float = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def drain(self) -> tuple:
+        """Return (timings, counters) collected so far and start over; used by worker processes"""
+        with self._lock:
+            collected = (self.timings, self.counters)
+            self.timings = {}
+            self.counters = {}
+        return collected
+
+    def merge(self, timings: dict, counters: dict):
+        """Add timings and counters collected in another process"""
+        with self._lock:
+            for name, values in timings.items():
+                self.timings.setdefault(name, []).extend(values)
+            for name, n in counters.items():
+                self.counters[name] = self.counters.get(name, 0) + n
+
+    @staticmethod
+    def _percentile(ordered: list, fraction: float) -> float:
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+    def to_dict(self) -> dict:
+        """Machine-readable snapshot: timing statistics in seconds plus counters"""
+        with self._lock:
+            timings = {name: sorted(values) for name, values in self.timings.items()}
+            counters = dict(self.counters)
+
+        return {
+            "started": self.started,
+            "elapsed": time.time() - self.started,
+            "timings": {
+                name: {
+                    "count": len(values),
+                    "total": sum(values),
+                    "mean": sum(values) / len(values),
+                    "p50": self._percentile(values, 0.5),
+                    "p95": self._percentile(values, 0.95),
+                    "max": values[-1],
+                }
+                for name, values in sorted(timings.items())
+            },
+            "counters": dict(sorted(counters.items())),
+        }
+
+    def print_summary(self):
+        """End-of-run table of timings and counters"""
+        data = self.to_dict()
+        print(f"\n⏱️ Run metrics ({data['elapsed']:.1f}s wall clock):")
+        if data["timings"]:
+            print(f"   {'Timing':<32} {'Count':>6} {'Total s':>9} {'Mean s':>8} {'p95 s':>8} {'Max s':>8}")
+            for name, t in data["timings"].items():
+                print(f"   {name[:32]:<32} {t['count']:>6} {t['total']:>9.2f} {t['mean']:>8.3f} "
+                      f"{t['p95']:>8.3f} {t['max']:>8.3f}")
+        if data["counters"]:
+            print(f"   {'Counter':<32} {'Value':>12}")
+            for name, value in data["counters"].items():
+                print(f"   {name[:32]:<32} {value:>12,.0f}")
+
+    def write_json(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+metrics = Metrics()
+
+_quiet = QUIET
+
+
+def set_quiet(quiet: bool):
+    """Turn per-article progress output off (end-of-run summaries are always printed)"""
+    global _quiet
+    _quiet = quiet
+
+
+def log(message: str):
+    """Per-article progress output, suppressed in quiet mode"""
+    if not _quiet:
+        print(message)
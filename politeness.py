@@ -0,0 +1,121 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from config import (
+    HOST_MIN_INTERVAL, HOST_MAX_CONCURRENCY, HOST_BACKOFF_BASE, HOST_BACKOFF_MAX, HOST_BACKOFF_STATUSES,
+)
+from strategy_stats import domain_of
+
+
+class HostScheduler:
+    """
+    Per-host request pacing shared by all worker threads.
+
+    Each host gets at most max_concurrency requests in flight, request starts at least
+    min_interval apart, and an exponential backoff window after refusals (403/429/503,
+    or the server's Retry-After). Only threads waiting on the same host are held back;
+    requests to other hosts go ahead immediately.
+    """
+
+    def __init__(self, min_interval: float = HOST_MIN_INTERVAL, max_concurrency: int = HOST_MAX_CONCURRENCY,
+                 backoff_base: float = HOST_BACKOFF_BASE, backoff_max: float = HOST_BACKOFF_MAX):
+        self.min_interval = min_interval
+        self.max_concurrency = max_concurrency
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._cond = threading.Condition()
+        self._hosts = {}
+        self.waited = 0.0
+        self.backoffs = 0
+
+    def _state(self, host: str) -> dict:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = {"active": 0, "next_start": 0.0, "backoff_until": 0.0, "failures": 0}
+        return state
+
+    @contextmanager
+    def slot(self, url_or_host: str):
+        """Hold a request slot for the URL's host, waiting for pacing and backoff first"""
+        host = domain_of(url_or_host) if "://" in url_or_host else url_or_host
+        start = time.monotonic()
+        with self._cond:
+            state = self._state(host)
+            while True:
+                now = time.monotonic()
+                ready_at = max(state["next_start"], state["backoff_until"])
+                if state["active"] < self.max_concurrency and now >= ready_at:
+                    break
+                self._cond.wait(timeout=ready_at - now if now < ready_at else None)
+            state["active"] += 1
+            state["next_start"] = now + self.min_interval
+            self.waited += now - start
+        try:
+            yield
+        finally:
+            with self._cond:
+                state["active"] -= 1
+                self._cond.notify_all()
+
+    def penalize(self, url_or_host: str, status: int = None, retry_after: float = None):
+        """
+        Back off a host after a refusal. Only HOST_BACKOFF_STATUSES (or a missing status,
+        e.g. a challenge page) count; Retry-After wins over the exponential delay.
+        """
+        if status is not None and status not in HOST_BACKOFF_STATUSES:
+            return
+        host = domain_of(url_or_host) if "://" in url_or_host else url_or_host
+        with self._cond:
+            state = self._state(host)
+            state["failures"] += 1
+            delay = self.backoff_base * 2 ** (state["failures"] - 1)
+            if retry_after is not None:
+                delay = retry_after
+            delay = min(delay, self.backoff_max)
+            state["backoff_until"] = max(state["backoff_until"], time.monotonic() + delay)
+            self.backoffs += 1
+            self._cond.notify_all()
+
+    def succeed(self, url_or_host: str):
+        """Reset a host's backoff after a successful request"""
+        host = domain_of(url_or_host) if "://" in url_or_host else url_or_host
+        with self._cond:
+            self._state(host)["failures"] = 0
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {"hosts": len(self._hosts), "waited": self.waited, "backoffs": self.backoffs}
+
+
+def retry_after_header(response):
+    """Retry-After in seconds from a requests response, if it is given as a number"""
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After", "")
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+def interleave_by_host(urls: list) -> list:
+    """
+    Indices of urls reordered round-robin across hosts, so consecutive submissions go to
+    different sites and pool workers are not all parked behind one slow host.
+    """
+    queues = {}
+    for i, url in enumerate(urls):
+        queues.setdefault(domain_of(url), []).append(i)
+
+    order = []
+    queues = list(queues.values())
+    depth = 0
+    while queues:
+        queues = [queue for queue in queues if depth < len(queue)]
+        order.extend(queue[depth] for queue in queues)
+        depth += 1
+    return order
+
+
+host_scheduler = HostScheduler()
@@ -0,0 +1,274 @@
+import html
+import json
+import os
+import threading
+from datetime import datetime
+
+from config import OUTPUT_FILE
+from storage import AWST, convert_to_awst
+
+REPORT_TITLE = "Digital Health News Summary - Australia"
+
+
+class ReportWriter:
+    """
+    Output backend that receives records one at a time, in report order.
+    open() is called once with the number of records to expect, write() once per
+    record, and close() returns the path of the finished file.
+    """
+
+    extension = ""
+
+    def __init__(self, generated: datetime):
+        self.generated = generated
+        timestamp = generated.strftime("%Y%m%d_%H%M%S")
+        stem = os.path.splitext(OUTPUT_FILE)[0]
+        self.path = f"{stem}_{timestamp}{self.extension}"
+        self.count = 0
+        self.total = 0
+
+    @property
+    def generated_label(self) -> str:
+        return self.generated.strftime('%d %B %Y at %I:%M %p AWST')
+
+    def open(self, total: int):
+        self.total = total
+
+    def write(self, record: dict):
+        self.count += 1
+
+    def close(self) -> str:
+        return self.path
+
+
+class DocxWriter(ReportWriter):
+    """Word document in the original layout; paragraphs are added as records arrive"""
+
+    extension = ".docx"
+
+    def open(self, total: int):
+        super().open(total)
+        from docx import Document
+        from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+
+        self.document = Document()
+
+        title = self.document.add_heading(REPORT_TITLE, level=1)
+        title.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+
+        meta = self.document.add_paragraph()
+        meta_run = meta.add_run(f"Generated: {self.generated_label} | Total Articles: {total}")
+        meta_run.italic = True
+        meta.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+
+        self.document.add_paragraph()  # Single spacing
+
+    def write(self, record: dict):
+        super().write(record)
+        document = self.document
+        document.add_heading(f"Article {self.count}", level=2)
+
+        title_para = document.add_paragraph()
+        title_para.add_run("Title: ").bold = True
+        title_para.add_run(record.get('Title', 'Untitled'))
+
+        summary_para = document.add_paragraph()
+        summary_para.add_run("Summary:").bold = True
+
+        # Bullet points are already formatted by the summarizer
+        document.add_paragraph(record.get('Summary', 'Summary not available.'))
+
+        source_para = document.add_paragraph()
+        source_para.add_run("Source: ").bold = True
+        source_para.add_run(record.get('Link', 'N/A'))
+
+        if record.get('Same story as'):
+            same_para = document.add_paragraph()
+            same_para.add_run("Same story as: ").bold = True
+            same_para.add_run(record['Same story as'])
+
+        date_para = document.add_paragraph()
+        date_para.add_run("Published: ").bold = True
+        date_para.add_run(convert_to_awst(record.get('Date', 'N/A')))
+
+        # Separator between articles (only if not the last article)
+        if self.count < self.total:
+            document.add_paragraph("─" * 80)
+
+    def close(self) -> str:
+        self.document.save(self.path)
+        self.document = None
+        return self.path
+
+
+class JsonlWriter(ReportWriter):
+    """One JSON object per line, flushed per record so other tools can tail the file"""
+
+    extension = ".jsonl"
+
+    def open(self, total: int):
+        super().open(total)
+        self.file = open(self.path, "w", encoding="utf-8")
+
+    def write(self, record: dict):
+        super().write(record)
+        row = dict(record, Published=convert_to_awst(record.get('Date', 'N/A')))
+        self.file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self.file.flush()
+
+    def close(self) -> str:
+        self.file.close()
+        return self.path
+
+
+class MarkdownWriter(ReportWriter):
+    extension = ".md"
+
+    def open(self, total: int):
+        super().open(total)
+        self.file = open(self.path, "w", encoding="utf-8")
+        self.file.write(f"# {REPORT_TITLE}\n\n_Generated: {self.generated_label} | Total Articles: {total}_\n\n")
+
+    def write(self, record: dict):
+        super().write(record)
+        self.file.write(
+            f"## Article {self.count}\n\n"
+            f"**Title:** {record.get('Title', 'Untitled')}\n\n"
+            f"**Summary:**\n\n{record.get('Summary', 'Summary not available.')}\n\n"
+            f"**Source:** <{record.get('Link', 'N/A')}>\n\n"
+            + (f"**Same story as:** <{record['Same story as']}>\n\n" if record.get('Same story as') else "")
+            + f"**Published:** {convert_to_awst(record.get('Date', 'N/A'))}\n\n"
+            + ("---\n\n" if self.count < self.total else "")
+        )
+        self.file.flush()
+
+    def close(self) -> str:
+        self.file.close()
+        return self.path
+
+
+class HtmlWriter(ReportWriter):
+    extension = ".html"
+
+    def open(self, total: int):
+        super().open(total)
+        self.file = open(self.path, "w", encoding="utf-8")
+        self.file.write(
+            "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+            f"<title>{html.escape(REPORT_TITLE)}</title></head><body>\n"
+            f"<h1>{html.escape(REPORT_TITLE)}</h1>\n"
+            f"<p><em>Generated: {html.escape(self.generated_label)} | Total Articles: {total}</em></p>\n"
+        )
+
+    def write(self, record: dict):
+        super().write(record)
+        link = html.escape(record.get('Link', 'N/A'))
+        same = html.escape(record.get('Same story as', ''))
+        self.file.write(
+            f"<article>\n<h2>Article {self.count}</h2>\n"
+            f"<p><strong>Title:</strong> {html.escape(record.get('Title', 'Untitled'))}</p>\n"
+            f"<p><strong>Summary:</strong></p>\n"
+            f"<pre style=\"white-space: pre-wrap; font-family: inherit\">"
+            f"{html.escape(record.get('Summary', 'Summary not available.'))}</pre>\n"
+            f"<p><strong>Source:</strong> <a href=\"{link}\">{link}</a></p>\n"
+            + (f"<p><strong>Same story as:</strong> <a href=\"{same}\">{same}</a></p>\n" if same else "")
+            + f"<p><strong>Published:</strong> {html.escape(convert_to_awst(record.get('Date', 'N/A')))}</p>\n"
+            + "</article>\n"
+            + ("<hr>\n" if self.count < self.total else "")
+        )
+        self.file.flush()
+
+    def close(self) -> str:
+        self.file.write("</body></html>\n")
+        self.file.close()
+        return self.path
+
+
+class XlsxWriter(ReportWriter):
+    """Spreadsheet with one row per article (openpyxl write-only mode, rows streamed to a temp file)"""
+
+    extension = ".xlsx"
+
+    def open(self, total: int):
+        super().open(total)
+        from openpyxl import Workbook
+
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet("Articles")
+        self.sheet.append(["#", "Title", "Summary", "Link", "Published (AWST)", "Date", "Same story as"])
+
+    def write(self, record: dict):
+        super().write(record)
+        self.sheet.append([
+            self.count,
+            record.get('Title', 'Untitled'),
+            record.get('Summary', 'Summary not available.'),
+            record.get('Link', 'N/A'),
+            convert_to_awst(record.get('Date', 'N/A')),
+            record.get('Date', ''),
+            record.get('Same story as', ''),
+        ])
+
+    def close(self) -> str:
+        self.workbook.save(self.path)
+        return self.path
+
+
+WRITERS = {
+    "docx": DocxWriter,
+    "jsonl": JsonlWriter,
+    "md": MarkdownWriter,
+    "html": HtmlWriter,
+    "xlsx": XlsxWriter,
+}
+
+
+class ReportStream:
+    """
+    Fans finished records out to every configured writer in report (relevance) order.
+    Records may arrive in any order from any thread; each is held only until all
+    records ahead of it in `order` have arrived, then written straight through.
+    """
+
+    def __init__(self, formats: list, order: list, generated: datetime = None):
+        unknown = [f for f in formats if f not in WRITERS]
+        if unknown:
+            raise ValueError(f"Unknown report format(s): {', '.join(unknown)} (choose from {', '.join(WRITERS)})")
+
+        generated = generated or datetime.now(AWST)
+        self.writers = [WRITERS[f](generated) for f in formats]
+        self.order = list(order)
+        self.pending = {}
+        self.next = 0
+        self._lock = threading.Lock()
+        for writer in self.writers:
+            writer.open(len(self.order))
+
+    def add(self, index: int, record: dict):
+        """Accept the record for results[index]; writes every record that is now in order"""
+        with self._lock:
+            self.pending[index] = record
+            while self.next < len(self.order) and self.order[self.next] in self.pending:
+                ready = self.pending.pop(self.order[self.next])
+                for writer in self.writers:
+                    writer.write(ready)
+                self.next += 1
+
+    def close(self) -> list:
+        """Finish every writer and return the written paths"""
+        with self._lock:
+            missing = [index for index in self.order[self.next:] if index not in self.pending]
+            if missing:
+                print(f"⚠️ Report is missing {len(missing)} articles")
+            # Write whatever arrived after the gaps, still in order
+            for index in self.order[self.next:]:
+                if index in self.pending:
+                    ready = self.pending.pop(index)
+                    for writer in self.writers:
+                        writer.write(ready)
+            self.next = len(self.order)
+            paths = [writer.close() for writer in self.writers]
+
+        for writer, path in zip(self.writers, paths):
+            print(f"\n✅ Saved {writer.count} articles to {path}")
+        return paths
@@ -1,80 +1,121 @@
 import requests
-import feedparser
-from datetime import datetime, timedelta
-from config import SEARCH_QUERIES, MAX_RESULTS_PER_QUERY, TIME_FILTER
+from config import (
+    SEARCH_QUERIES, MAX_RESULTS_PER_QUERY, TIME_FILTER,
+    SEARCH_CONCURRENT, SEARCH_WORKERS, SEARCH_PROVIDER_LIMITS,
+    MIN_RELEVANCE_SCORE, TOP_K_RESULTS, CACHE_DIR,
+    SEARCH_CACHE_ENABLED, SEARCH_CACHE_TTL_MINUTES, SEARCH_CACHE_KEEP_DAYS, SEARCH_CACHE_MAX_MB,
+    TITLE_DEDUPE_LSH,
+)
 from urllib.parse import urlparse, quote
 import xml.etree.ElementTree as ET
+import json
+import os
 import time
-from ddgs import DDGS
-from difflib import SequenceMatcher
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http_session import sessions
+from cache import DiskCache
+from dedupe import normalize_url, are_titles_similar, is_duplicate, DedupeIndex
+from dates import recent_flags
+from politeness import host_scheduler
+from metrics import metrics, log
 
 # Import keywords, domains, and scoring function from separate file
-from keywords import calculate_relevance_score
+from keywords import score_items
 
+# ddgs.DDGS, imported on first DuckDuckGo search (see ddgs_class)
+DDGS = None
 
-def normalize_url(url: str) -> str:
-    """Normalize URL for comparison (remove query params, fragments, trailing slashes)"""
-    try:
-        from urllib.parse import urlparse, urlunparse
-        parsed = urlparse(url)
-        # Remove query params and fragments, normalize path
-        normalized = urlunparse((
-            parsed.scheme.lower(),
-            parsed.netloc.lower(),
-            parsed.path.rstrip('/'),
-            '', '', ''
-        ))
-        return normalized
-    except:
-        return url.lower().strip()
-
-
-def are_titles_similar(title1: str, title2: str, threshold: float = 0.90) -> bool:
-    """Check if two titles are similar using sequence matching"""
-    if not title1 or not title2:
-        return False
-    
-    # Normalize titles
-    t1 = title1.lower().strip()
-    t2 = title2.lower().strip()
-    
-    # Calculate similarity ratio
-    ratio = SequenceMatcher(None, t1, t2).ratio()
-    return ratio >= threshold
+
+def ddgs_class():
+    global DDGS
+    if DDGS is None:
+        from ddgs import DDGS as ddgs
+        DDGS = ddgs
+    return DDGS
+
+
+# Provider responses from earlier runs, keyed by provider, query and request parameters.
+# Entries outlive their TTL (SEARCH_CACHE_KEEP_DAYS) so stale feeds can be revalidated.
+search_cache = DiskCache(
+    os.path.join(CACHE_DIR, "search.sqlite"),
+    ttl_seconds=SEARCH_CACHE_KEEP_DAYS * 86400,
+    max_bytes=SEARCH_CACHE_MAX_MB * 1024 * 1024,
+) if SEARCH_CACHE_ENABLED else None
+
+# (query, provider) -> (status, age of the data used in seconds) for the current search_news() call
+cache_status = {}
+_cache_status_lock = threading.Lock()
+
+
+def cached_results(provider: str, key: str) -> tuple:
+    """(results, meta, fresh) for a cached provider response, or (None, {}, False)"""
+    if search_cache is None:
+        return None, {}, False
+    cached = search_cache.get(key)
+    if cached is None:
+        return None, {}, False
+    text, meta = cached
+    age = time.time() - meta.get("fetched", 0)
+    return json.loads(text), meta, age <= SEARCH_CACHE_TTL_MINUTES.get(provider, 0) * 60
 
 
-def is_duplicate(new_item: dict, existing_items: list) -> bool:
+def store_results(key: str, results: list, meta: dict):
+    if search_cache is not None:
+        search_cache.set(key, json.dumps(results), dict(meta, fetched=time.time()))
+
+
+def record_cache_status(query: str, provider: str, status: str, meta: dict = None):
     """
-    Check if an article is a duplicate based on:
-    1. Exact URL match (after normalization)
-    2. Very similar title (>85% match)
+    Remember how a provider request was answered:
+    fresh (cache within TTL, no request), not modified (304), unchanged / changed
+    (refetched; same or different links than the stale copy), new (nothing cached) or off.
     """
-    new_url = normalize_url(new_item.get('link', ''))
-    new_title = new_item.get('title', '')
-    
-    for existing in existing_items:
-        existing_url = normalize_url(existing.get('link', ''))
-        existing_title = existing.get('title', '')
-        
-        # Check URL match
-        if new_url and existing_url and new_url == existing_url:
-            return True
-        
-        # Check title similarity
-        if are_titles_similar(new_title, existing_title):
-            return True
-    
-    return False
+    age = time.time() - meta["fetched"] if meta and "fetched" in meta else 0.0
+    with _cache_status_lock:
+        cache_status[(query, provider)] = (status, age)
+    metrics.count(f"search.cache.{status.replace(' ', '_')}")
+
+
+def refetch_status(previous: list, results: list) -> str:
+    if previous is None:
+        return "new" if search_cache is not None else "off"
+    same = [r.get("link") for r in previous] == [r.get("link") for r in results]
+    return "unchanged" if same else "changed"
 
 
 def search_google_news_rss(query: str, max_results: int = 10) -> list:
-    """Search Google News via RSS feed with AU region"""
+    """
+    Search Google News via RSS feed with AU region.
+    Within the TTL the cached results are used as-is; after that the feed is requested
+    with its ETag / Last-Modified, and a 304 reuses the cached results without parsing.
+    """
     try:
         au_query = f"{query}"
         base_url = "https://news.google.com/rss/search"
         url = f"{base_url}?q={requests.utils.quote(au_query)}&hl=en-AU"
-        
-        response = requests.get(url, timeout=20)
+        key = f"google\0{url}\0{max_results}"
+
+        previous, meta, fresh = cached_results("google", key)
+        if fresh:
+            record_cache_status(query, "google", "fresh", meta)
+            return previous
+
+        headers = {}
+        if previous is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = sessions.session().get(url, timeout=20, headers=headers)
+        if response.status_code == 304 and previous is not None:
+            record_cache_status(query, "google", "not modified", meta)
+            store_results(key, previous, meta)
+            return previous
+
+        import feedparser
+
         feed = feedparser.parse(response.content)
         
         results = []
@@ -88,6 +129,12 @@ def search_google_news_rss(query: str, max_results: int = 10) -> list:
             
             results.append(item)
         
+        if response.ok:
+            record_cache_status(query, "google", refetch_status(previous, results))
+            store_results(key, results, {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            })
         return results
     
     except Exception as e:
@@ -96,12 +143,18 @@ def search_google_news_rss(query: str, max_results: int = 10) -> list:
 
 
 def search_duckduckgo_news(query, max_results=20, timelimit="w", retries=2):
-    
+    """DuckDuckGo news search; results are reused for the provider's cache TTL"""
+    key = f"duckduckgo\0{query}\0{max_results}\0{timelimit}"
+    previous, meta, fresh = cached_results("duckduckgo", key)
+    if fresh:
+        record_cache_status(query, "duckduckgo", "fresh", meta)
+        return previous
 
     for attempt in range(retries):
         try:
             results = []
-            with DDGS(timeout=20) as ddgs:
+            # Shared pacing for every DDG query; a failure backs off all of them, not just this one
+            with host_scheduler.slot("duckduckgo.com"), ddgs_class()(timeout=20) as ddgs:
                 for r in ddgs.news(
                     query,
                     region="au-en",
@@ -114,39 +167,119 @@ def search_duckduckgo_news(query, max_results=20, timelimit="w", retries=2):
                         "date": r.get("date"),
                         "source": "DuckDuckGo"
                     })
+            host_scheduler.succeed("duckduckgo.com")
+            record_cache_status(query, "duckduckgo", refetch_status(previous, results))
+            store_results(key, results, {})
             return results
 
         except Exception as e:
             print(f"      ⚠️ DuckDuckGo timeout (attempt {attempt+1}/{retries})")
-            time.sleep(2)
+            host_scheduler.penalize("duckduckgo.com")
 
     return []
 
 
-def filter_by_date(results: list, days: int = 7) -> list:
-    """Filter results to only include recent articles"""
+def filter_by_date(results: list, days: int = 7) -> tuple:
+    """
+    Keep results published within the last `days`.
+    Results without a parseable date are kept rather than silently dropped.
+    Returns (kept results, number of stale results removed, number of undated results kept).
+    """
     if not days:
-        return results
-    
-    cutoff_date = datetime.now() - timedelta(days=days)
-    filtered = []
-    
-    for item in results:
-        try:
-            date_str = item.get("date", "")
-            if date_str:
-                for fmt in ["%Y-%m-%dT%H:%M:%S%z", "%a, %d %b %Y %H:%M:%S %Z", "%Y-%m-%d"]:
-                    try:
-                        article_date = datetime.strptime(date_str.split('+')[0].strip(), fmt.replace("%z", ""))
-                        if article_date >= cutoff_date:
-                            filtered.append(item)
-                        break
-                    except:
-                        continue
-        except:
-            filtered.append(item)
-    
-    return filtered
+        return results, 0, 0
+
+    kept = []
+    stale = 0
+    undated = 0
+    for item, recent in zip(results, recent_flags(results, days)):
+        if recent is False:
+            stale += 1
+            continue
+        if recent is None:
+            undated += 1
+        kept.append(item)
+    return kept, stale, undated
+
+
+# Per-provider in-flight limits shared by all search worker threads
+_provider_slots = {
+    provider: threading.BoundedSemaphore(limit)
+    for provider, limit in SEARCH_PROVIDER_LIMITS.items()
+}
+
+
+def run_provider(provider: str, query: str) -> list:
+    """Run one provider search for a query, respecting the provider's in-flight limit"""
+    with _provider_slots[provider], metrics.timer(f"search.{provider}"):
+        if provider == "google":
+            results = search_google_news_rss(query, MAX_RESULTS_PER_QUERY)
+        else:
+            results = search_duckduckgo_news(query, MAX_RESULTS_PER_QUERY, TIME_FILTER)
+    metrics.count(f"search.{provider}.results", len(results))
+    return results
+
+
+def print_cache_report(queries: list):
+    """Per-query cache status for each provider, plus totals (to tune SEARCH_CACHE_TTL_MINUTES)"""
+    if search_cache is None:
+        return
+    with _cache_status_lock:
+        status = dict(cache_status)
+
+    log(f"   💾 Search cache (status, age of data used):")
+    for query in queries:
+        parts = []
+        for provider in ("google", "duckduckgo"):
+            if (query, provider) in status:
+                state, age = status[(query, provider)]
+                parts.append(f"{provider}: {state}" + (f" ({age / 60:.0f} min)" if age else ""))
+        log(f"      '{query}': " + ", ".join(parts))
+
+    totals = {}
+    for state, _ in status.values():
+        totals[state] = totals.get(state, 0) + 1
+    order = ["fresh", "not modified", "unchanged", "changed", "new"]
+    print(f"   💾 Search cache: " + ", ".join(f"{totals[state]} {state}" for state in order if state in totals))
+
+
+def fetch_query_results(queries: list, concurrent: bool = SEARCH_CONCURRENT) -> list:
+    """
+    Run every provider for every query.
+    Returns one list per query, holding Google News results followed by DuckDuckGo results,
+    in query order regardless of the order in which requests complete.
+    """
+    providers = ["google", "duckduckgo"]
+
+    if not concurrent:
+        per_query = []
+        for query_num, query in enumerate(queries, 1):
+            log(f"   Query {query_num}/{len(queries)}: '{query}'")
+            log(f"      Trying Google News RSS ...")
+            google_results = run_provider("google", query)
+            log(f"      Trying DuckDuckGo...")
+            ddg_results = run_provider("duckduckgo", query)
+            per_query.append(google_results + ddg_results)
+        return per_query
+
+    print(f"   ⚡ Fanning out {len(queries) * len(providers)} searches "
+          f"({SEARCH_WORKERS} in flight, per provider: {SEARCH_PROVIDER_LIMITS})")
+
+    with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as pool:
+        futures = [
+            [pool.submit(run_provider, provider, query) for provider in providers]
+            for query in queries
+        ]
+        per_query = []
+        for query_futures in futures:
+            combined = []
+            for future in query_futures:
+                try:
+                    combined.extend(future.result())
+                except Exception as e:
+                    print(f"      ⚠️ Search error: {e}")
+            per_query.append(combined)
+
+    return per_query
 
 
 def search_news():
@@ -155,72 +288,72 @@ def search_news():
     Removes duplicates based on URL normalization and title similarity.
     """
     all_results = []
+    dedupe_index = DedupeIndex(lsh=TITLE_DEDUPE_LSH)
     duplicates_removed = 0
     
     print(f"🔎 Running {len(SEARCH_QUERIES)} search queries for news...")
     print(f"🎯 Will return ALL unique articles sorted by relevance score\n")
     
-    for query_num, query in enumerate(SEARCH_QUERIES, 1):
-        print(f"   Query {query_num}/{len(SEARCH_QUERIES)}: '{query}'")
-        
-        # Try Google News RSS first
-        print(f"      Trying Google News RSS ...")
-        google_results = search_google_news_rss(query, MAX_RESULTS_PER_QUERY)
-        
-        # Try DuckDuckGo as fallback
-        print(f"      Trying DuckDuckGo...")
-        ddg_results = search_duckduckgo_news(query, MAX_RESULTS_PER_QUERY, TIME_FILTER)
-        
-        # Combine results
-        combined = google_results + ddg_results
-        
+    with _cache_status_lock:
+        cache_status.clear()
+    per_query_results = fetch_query_results(SEARCH_QUERIES)
+    print_cache_report(SEARCH_QUERIES)
+
+    # Drop stale results before dedupe so they never reach the title index
+    days_filter = {"d": 1, "w": 7, "m": 30}.get(TIME_FILTER, None)
+    if days_filter:
+        stale_total = 0
+        undated_total = 0
+        filtered_results = []
+        for combined in per_query_results:
+            kept, stale, undated = filter_by_date(combined, days_filter)
+            filtered_results.append(kept)
+            stale_total += stale
+            undated_total += undated
+        per_query_results = filtered_results
+        metrics.count("search.stale", stale_total)
+        metrics.count("search.undated", undated_total)
+        print(f"   ✂️ Filtered to last {days_filter} days: {stale_total} older results removed, "
+              f"{undated_total} kept without a parseable date")
+
+    # Merge in query order so the dedupe outcome matches a serial run
+    dedupe_start = time.perf_counter()
+    for query, combined in zip(SEARCH_QUERIES, per_query_results):
         # Deduplicate using enhanced method
         new_results = 0
         for item in combined:
-            if not is_duplicate(item, all_results):
+            if dedupe_index.add_if_new(item):
                 all_results.append(item)
                 new_results += 1
             else:
                 duplicates_removed += 1
         
-        print(f"      → Found {len(combined)} results ({new_results} new, {len(combined)-new_results} duplicates)")
-    
-    # Filter by date if needed
-    days_filter = {"d": 1, "w": 7, "m": 30}.get(TIME_FILTER, None)
-    if days_filter:
-        before_filter = len(all_results)
-        all_results = filter_by_date(all_results, days_filter)
-        print(f"\n✂️ Filtered to last {days_filter} days: {before_filter} → {len(all_results)} articles")
+        log(f"      → '{query}': Found {len(combined)} results ({new_results} new, {len(combined)-new_results} duplicates)")
     
+    metrics.observe("search.dedupe", time.perf_counter() - dedupe_start)
+    metrics.count("search.duplicates", duplicates_removed)
+
     print(f"\n📊 Total unique articles found: {len(all_results)}")
     print(f"🗑️ Duplicates removed: {duplicates_removed}")
     
-    # Calculate relevance scores for all articles using proprietary algorithm
+    # Score, drop low scorers and sort once, before any article is fetched
     print(f"🔢 Calculating relevance scores...")
-    for item in all_results:
-        item['relevance_score'] = calculate_relevance_score(item)
-    
-    # Sort by relevance score (highest first)
-    all_results.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-
-    all_results.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-
-    # Keep only articles with relevance score > 1
-    MIN_RELEVANCE_SCORE = 1
-    all_results = [
-        item for item in all_results
-        if item.get('relevance_score', 0) > MIN_RELEVANCE_SCORE
-    ]
+    with metrics.timer("search.scoring"):
+        scored_total = len(all_results)
+        all_results = score_items(all_results, MIN_RELEVANCE_SCORE, TOP_K_RESULTS)
+    metrics.count("search.pruned", scored_total - len(all_results))
+    if TOP_K_RESULTS is not None:
+        print(f"   ✂️ Keeping the top {TOP_K_RESULTS} results")
     
     # Display scoring results
-    print(f"\n{'='*80}")
-    print(f"🏆 ALL ARTICLES SORTED BY RELEVANCE SCORE:")
-    print(f"{'='*80}\n")
+    log(f"\n{'='*80}")
+    log(f"🏆 ALL ARTICLES SORTED BY RELEVANCE SCORE:")
+    log(f"{'='*80}\n")
     
     for i, item in enumerate(all_results, 1):
         score = item.get('relevance_score', 0)
         title = item.get('title', 'Untitled')[:70]
-        print(f"  {i}. [{score:.1f} pts] {title}...")
+        log(f"  {i}. [{score:.1f} pts] {title}...")
     
     print(f"\n{'='*80}")
     print(f"\n📊 Articles with relevance score > {MIN_RELEVANCE_SCORE}: {len(all_results)}")
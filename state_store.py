@@ -0,0 +1,140 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from dedupe import normalize_url
+
+# Trailing " - Publisher" / " | Publisher" that Google News appends to titles
+TITLE_SOURCE_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{1,40}$")
+
+
+def title_fingerprint(title: str) -> str:
+    """Hash of a title's words, ignoring case, punctuation and a trailing publisher name"""
+    title = TITLE_SOURCE_SUFFIX.sub("", title or "")
+    words = re.findall(r"\w+", title.lower())
+    if not words:
+        return ""
+    return hashlib.sha1(" ".join(words).encode("utf-8")).hexdigest()
+
+
+class StateStore:
+    """
+    Articles processed by earlier runs, persisted in SQLite.
+    Rows are keyed by normalized URL and also indexed by title fingerprint, so the
+    same story found under a different link is recognised too. Rows not seen for
+    retention_days are dropped when the store is opened. Safe to share between threads.
+    """
+
+    def __init__(self, path: str, retention_days: float = None):
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS articles (
+                url_key TEXT PRIMARY KEY,
+                title_key TEXT NOT NULL,
+                title TEXT NOT NULL,
+                link TEXT NOT NULL,
+                date TEXT,
+                summary TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS articles_title_key ON articles (title_key)")
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(articles)")}
+        if "body_hash" not in columns:
+            # Stores created before body fingerprints were kept
+            self._conn.execute("ALTER TABLE articles ADD COLUMN body_hash INTEGER")
+        if retention_days is not None:
+            self._conn.execute("DELETE FROM articles WHERE last_seen < ?", (time.time() - retention_days * 86400,))
+        self._conn.commit()
+
+    def lookup(self, item: dict):
+        """Stored row (as a dict) for a search result by URL or title fingerprint, or None"""
+        url_key = normalize_url(item.get("link", ""))
+        title_key = title_fingerprint(item.get("title", ""))
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM articles WHERE url_key = ?", (url_key,)).fetchone()
+            if row is None and title_key:
+                row = self._conn.execute(
+                    "SELECT * FROM articles WHERE title_key = ? ORDER BY last_seen DESC LIMIT 1", (title_key,)
+                ).fetchone()
+        return dict(row) if row is not None else None
+
+    def partition(self, items: list) -> tuple:
+        """
+        Split search results into (new items, {index: stored row} for already processed items).
+        Stored rows that are seen again get their last_seen refreshed.
+        """
+        new_items = []
+        previous = {}
+        for i, item in enumerate(items):
+            row = self.lookup(item)
+            if row is None:
+                new_items.append(item)
+            else:
+                previous[i] = row
+
+        if previous:
+            now = time.time()
+            with self._lock:
+                self._conn.executemany(
+                    "UPDATE articles SET last_seen = ? WHERE url_key = ?",
+                    [(now, row["url_key"]) for row in previous.values()],
+                )
+                self._conn.commit()
+        return new_items, previous
+
+    def body_fingerprints(self) -> list:
+        """(body SimHash, stored row) for every remembered article with a body fingerprint"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT link, title, summary, body_hash FROM articles WHERE body_hash IS NOT NULL"
+            ).fetchall()
+        # SQLite integers are signed; fingerprints are unsigned 64-bit
+        return [(row["body_hash"] & (2 ** 64 - 1), dict(row)) for row in rows]
+
+    def record(self, item: dict, summary: str, body_hash: int = None):
+        """Remember a processed article, its summary and (optionally) its body SimHash"""
+        now = time.time()
+        if body_hash is not None and body_hash >= 2 ** 63:
+            body_hash -= 2 ** 64
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO articles (url_key, title_key, title, link, date, summary, first_seen, last_seen, body_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(url_key) DO UPDATE SET title_key = excluded.title_key, title = excluded.title, "
+                "link = excluded.link, date = excluded.date, summary = excluded.summary, last_seen = excluded.last_seen, "
+                "body_hash = COALESCE(excluded.body_hash, body_hash)",
+                (
+                    normalize_url(item.get("link", "")),
+                    title_fingerprint(item.get("title", "")),
+                    item.get("title", ""),
+                    item.get("link", ""),
+                    item.get("date"),
+                    summary,
+                    now,
+                    now,
+                    body_hash,
+                ),
+            )
+            self._conn.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
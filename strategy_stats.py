@@ -0,0 +1,121 @@
+import json
+import os
+import threading
+from urllib.parse import urlparse
+
+
+def domain_of(url: str) -> str:
+    """Host name used to group strategy statistics (lowercase, without 'www.')"""
+    domain = urlparse(url).netloc.lower()
+    return domain[4:] if domain.startswith("www.") else domain
+
+
+class StrategyStats:
+    """
+    Success counts and latency per fetch strategy per domain, persisted as JSON across runs.
+    Used to try the strategy most likely to succeed first and to skip strategies
+    that keep failing on a host.
+    """
+
+    def __init__(self, path: str, skip_min_attempts: int = 5, skip_max_rate: float = 0.1):
+        self.path = path
+        self.skip_min_attempts = skip_min_attempts
+        self.skip_max_rate = skip_max_rate
+        self._lock = threading.Lock()
+        self.domains = {}
+
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.domains = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Could not load strategy stats from {path}: {e}")
+
+    def record(self, url: str, strategy: str, success: bool, latency: float):
+        """Record the outcome of one strategy attempt"""
+        with self._lock:
+            entry = self.domains.setdefault(domain_of(url), {}).setdefault(
+                strategy, {"attempts": 0, "successes": 0, "latency": 0.0}
+            )
+            entry["attempts"] += 1
+            entry["successes"] += int(success)
+            entry["latency"] += latency
+
+    def _score(self, entry: dict) -> tuple:
+        # Laplace-smoothed success rate first, then lower mean latency
+        attempts = entry["attempts"]
+        rate = (entry["successes"] + 1) / (attempts + 2)
+        mean_latency = entry["latency"] / attempts if attempts else 0.0
+        return (-rate, mean_latency)
+
+    def _failing(self, entry: dict) -> bool:
+        attempts = entry["attempts"]
+        return attempts >= self.skip_min_attempts and entry["successes"] / attempts <= self.skip_max_rate
+
+    def order(self, url: str, strategies: list) -> list:
+        """
+        Reorder (name, func) strategies for this URL's domain, best first.
+        Strategies that consistently fail on the domain are dropped, but at least one is always kept.
+        Unseen domains keep the default order.
+        """
+        with self._lock:
+            known = {name: dict(entry) for name, entry in self.domains.get(domain_of(url), {}).items()}
+
+        if not known:
+            return list(strategies)
+
+        fresh = {"attempts": 0, "successes": 0, "latency": 0.0}
+        ranked = sorted(
+            strategies,
+            key=lambda s: self._score(known.get(s[0], fresh)) + (strategies.index(s),),
+        )
+        kept = [s for s in ranked if not self._failing(known.get(s[0], fresh))]
+        return kept or ranked[:1]
+
+    def report(self) -> list:
+        """Rows of (domain, strategy, attempts, win rate, mean latency), busiest domains first"""
+        with self._lock:
+            domains = {d: {s: dict(e) for s, e in entries.items()} for d, entries in self.domains.items()}
+
+        rows = []
+        busiest = sorted(domains, key=lambda d: -sum(e["attempts"] for e in domains[d].values()))
+        for domain in busiest:
+            for strategy, entry in sorted(domains[domain].items(), key=lambda kv: self._score(kv[1])):
+                attempts = entry["attempts"]
+                rows.append((
+                    domain,
+                    strategy,
+                    attempts,
+                    entry["successes"] / attempts if attempts else 0.0,
+                    entry["latency"] / attempts if attempts else 0.0,
+                ))
+        return rows
+
+    def print_report(self, limit: int = 20):
+        """Print per-domain strategy win rates for the busiest domains"""
+        rows = self.report()
+        if not rows:
+            return
+
+        print(f"\n📈 Strategy win rates per domain:")
+        print(f"   {'Domain':<30} {'Strategy':<14} {'Tries':>6} {'Win %':>6} {'Avg s':>6}")
+        shown = []
+        for domain, strategy, attempts, rate, latency in rows:
+            if domain not in shown:
+                if len(shown) >= limit:
+                    break
+                shown.append(domain)
+            print(f"   {domain[:30]:<30} {strategy:<14} {attempts:>6} {rate:>6.0%} {latency:>6.2f}")
+
+    def save(self):
+        """Write statistics to disk"""
+        with self._lock:
+            data = json.dumps(self.domains, indent=2, sort_keys=True)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,85 @@
+from lxml import etree
+
+# Subtrees dropped while parsing (same boilerplate the BeautifulSoup path decomposes)
+SKIP_TAGS = {'script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'noscript', 'form', 'svg'}
+
+
+class StreamingExtractor:
+    """
+    Incremental article text collector fed with raw HTML chunks.
+
+    Runs lxml's HTML push parser with this object as the parser target, so no tree
+    is built. Text inside boilerplate subtrees is ignored as it streams past, and
+    <p> paragraphs are collected until target_chars of article text have been seen.
+    """
+
+    def __init__(self, target_chars: int = 12000, encoding: str = None):
+        self.target_chars = target_chars
+        self.paragraphs = []
+        self.collected = 0
+        self.done = False
+        self._skip_depth = 0
+        self._p_depth = 0
+        self._buffer = []
+        self._parser = etree.HTMLParser(target=self, encoding=encoding, recover=True, no_network=True)
+
+    # lxml parser target interface
+
+    def start(self, tag, attrib):
+        if not isinstance(tag, str):
+            return
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == 'p' and not self._skip_depth:
+            self._p_depth += 1
+        elif tag == 'br' and self._p_depth:
+            self._buffer.append(' ')
+
+    def end(self, tag):
+        if not isinstance(tag, str):
+            return
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag == 'p' and self._p_depth:
+            self._p_depth -= 1
+            if not self._p_depth:
+                self._finish_paragraph()
+
+    def data(self, data):
+        if self._p_depth and not self._skip_depth:
+            self._buffer.append(data)
+
+    def close(self):
+        return self.text()
+
+    def _finish_paragraph(self):
+        paragraph = ' '.join(''.join(self._buffer).split())
+        self._buffer = []
+        if self.done:
+            return  # the rest of an already fed chunk
+        # Same threshold clean_text() uses to drop navigation/metadata snippets
+        if len(paragraph) > 30:
+            self.paragraphs.append(paragraph)
+            self.collected += len(paragraph)
+            if self.collected >= self.target_chars:
+                self.done = True
+
+    # Public API
+
+    def feed(self, chunk: bytes) -> bool:
+        """Parse the next chunk of the body. Returns True once enough text has been collected."""
+        if not self.done:
+            self._parser.feed(chunk)
+        return self.done
+
+    def finish(self):
+        """Flush the parser after the last chunk (or after stopping early)"""
+        try:
+            self._parser.close()
+        except etree.LxmlError:
+            pass
+
+    def text(self) -> str:
+        return '\n\n'.join(self.paragraphs)
@@ -1,22 +1,39 @@
-from groq import Groq
-from config import GROQ_API_KEY
+from config import (
+    GROQ_MODEL, SUMMARY_TEMPERATURE, CACHE_DIR,
+    SUMMARY_CACHE_ENABLED, SUMMARY_CACHE_TTL_HOURS, SUMMARY_CACHE_MAX_MB,
+    SUMMARY_INPUT_TOKEN_BUDGET, SUMMARY_BATCH_TOKEN_BUDGET, SUMMARY_BATCH_MAX_ARTICLES, SUMMARY_BATCH_ARTICLE_MAX_CHARS,
+)
+from cache import DiskCache
+from llm_client import LLMClient
+from metrics import metrics, log
+from text_prep import estimate_tokens, prepare_for_summary
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
+import os
+import re
 
-client = Groq(api_key=GROQ_API_KEY)
+# Rate-limited Groq client shared by every summarization path
+llm = LLMClient()
+
+# Bump whenever the prompt changes so cached summaries from the old prompt are not reused
+PROMPT_VERSION = 2
+
+# Summaries from earlier runs, keyed by summary_cache_key()
+summary_cache = DiskCache(
+    os.path.join(CACHE_DIR, "summaries.sqlite"),
+    ttl_seconds=SUMMARY_CACHE_TTL_HOURS * 3600,
+    max_bytes=SUMMARY_CACHE_MAX_MB * 1024 * 1024,
+) if SUMMARY_CACHE_ENABLED else None
 
-def summarize(text: str) -> str:
-    """
-    Summarize article text using Groq API with structured format.
-    Returns a formatted summary with clear answers to WHO/WHAT/WHERE/WHEN/WHY/HOW.
-    """
-    if not text or not text.strip():
-        return "Summary not available - article text could not be extracted."
 
-    # Truncate very long articles to avoid token limits
-    max_chars = 8000
-    if len(text) > max_chars:
-        text = text[:max_chars] + "..."
+def summary_cache_key(text: str) -> str:
+    """Hash of everything that determines the summary: input text, prompt, model and temperature"""
+    material = f"{PROMPT_VERSION}\0{GROQ_MODEL}\0{SUMMARY_TEMPERATURE}\0{text}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
 
-    prompt = f"""You are an expert analyst of digital health and health technology news.
+
+SUMMARY_INSTRUCTIONS = """You are an expert analyst of digital health and health technology news.
 
 Your task:
 Summarize the key points of this article in 3-4 concise bullet points focusing on the health news.
@@ -38,22 +55,207 @@ IMPORTANT RULES:
 - Include specific details like names, organizations, dates, numbers
 - Be concise but informative
 - Do not add any extra text, headers, or commentary
+"""
+
+BATCH_INSTRUCTIONS = """You will receive {count} separate articles. Each one starts with a line <<<ARTICLE n>>> and ends with a line <<<END ARTICLE n>>>.
+Summarize EVERY article independently, following the rules above for each one.
+Start each summary with a line containing only ### ARTICLE n (the same n as the article) and output the summaries in order.
+Do not merge articles and do not skip any.
+"""
+
+BATCH_HEADER = re.compile(r"^[ \t]*#{2,}[ \t]*ARTICLE[ \t]+(\d+)[ \t]*:?[ \t]*$", re.IGNORECASE | re.MULTILINE)
+
+
+def prepare_text(text: str) -> str:
+    """Trim article text to the most informative paragraphs within SUMMARY_INPUT_TOKEN_BUDGET"""
+    return prepare_for_summary(text, SUMMARY_INPUT_TOKEN_BUDGET).text
+
 
+def cached_summary(text: str):
+    """Cached summary for already prepared text, or None"""
+    if summary_cache is None:
+        return None
+    cached = summary_cache.get(summary_cache_key(text))
+    return cached[0] if cached else None
+
+
+def store_summary(text: str, summary: str):
+    """Cache a summary for prepared text. Error placeholders are never cached."""
+    if summary_cache is not None and summary and "not available" not in summary.lower():
+        summary_cache.set(summary_cache_key(text), summary, {"model": GROQ_MODEL, "prompt_version": PROMPT_VERSION})
+
+
+def summary_prompt(text: str) -> str:
+    """Single-article prompt for prepared text"""
+    return f"""{SUMMARY_INSTRUCTIONS}
 Article text:
 {text}
 """
 
+
+def summarize(text: str) -> str:
+    """
+    Summarize article text using Groq API with structured format.
+    Returns a formatted summary with clear answers to WHO/WHAT/WHERE/WHEN/WHY/HOW.
+    """
+    if not text or not text.strip():
+        return "Summary not available - article text could not be extracted."
+
+    return summarize_prepared(prepare_text(text))
+
+
+def summarize_prepared(text: str) -> str:
+    """summarize() for text that already went through prepare_text()"""
+    cached = cached_summary(text)
+    if cached:
+        metrics.count("summary.cache_hits")
+        log(f"   💾 Summary cache hit")
+        return cached
+
+    try:
+        summary = llm.complete(summary_prompt(text), GROQ_MODEL, SUMMARY_TEMPERATURE, max_tokens=1000)
+    except Exception as e:
+        metrics.count("summary.errors")
+        log(f"   ⚠️ Summarization error: {e}")
+        return f"Summary not available - API error: {str(e)}"
+
+    if not summary:
+        return "Summary not available - no response generated."
+
+    store_summary(text, summary)
+    return summary
+
+
+async def summarize_async(text: str) -> str:
+    """summarize() on the asyncio client; concurrency is capped by LLM_CONCURRENCY"""
+    if not text or not text.strip():
+        return "Summary not available - article text could not be extracted."
+
+    # Text preparation and the SQLite cache would otherwise block every request in flight on the loop
+    text = await asyncio.to_thread(prepare_text, text)
+
+    cached = await asyncio.to_thread(cached_summary, text)
+    if cached:
+        metrics.count("summary.cache_hits")
+        log(f"   💾 Summary cache hit")
+        return cached
+
+    try:
+        summary = await llm.acomplete(summary_prompt(text), GROQ_MODEL, SUMMARY_TEMPERATURE, max_tokens=1000)
+    except Exception as e:
+        metrics.count("summary.errors")
+        log(f"   ⚠️ Summarization error: {e}")
+        return f"Summary not available - API error: {str(e)}"
+
+    if not summary:
+        return "Summary not available - no response generated."
+
+    await asyncio.to_thread(store_summary, text, summary)
+    return summary
+
+
+def pack_batches(texts: list, token_budget: int, max_articles: int) -> list:
+    """Group (index, text) pairs into batches whose estimated prompt size stays within token_budget"""
+    overhead = estimate_tokens(SUMMARY_INSTRUCTIONS + BATCH_INSTRUCTIONS)
+    batches = []
+    current = []
+    used = overhead
+    for index, text in texts:
+        cost = estimate_tokens(text) + 20  # delimiters
+        if current and (used + cost > token_budget or len(current) >= max_articles):
+            batches.append(current)
+            current = []
+            used = overhead
+        current.append((index, text))
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_batch_response(content: str, count: int) -> dict:
+    """
+    Split a batched response into {article number: summary}.
+    Articles whose section is missing, duplicated or empty are left out.
+    """
+    matches = list(BATCH_HEADER.finditer(content))
+    sections = {}
+    seen = set()
+    for i, match in enumerate(matches):
+        number = int(match.group(1))
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        body = content[match.end():end].strip()
+        if number in seen:
+            sections.pop(number, None)
+            continue
+        seen.add(number)
+        if 1 <= number <= count and body:
+            sections[number] = body
+    return sections
+
+
+def summarize_one_batch(batch: list) -> dict:
+    """Summarize one packed batch in a single request. Returns {index: summary} for parsed articles."""
+    articles = "\n\n".join(
+        f"<<<ARTICLE {n}>>>\n{text}\n<<<END ARTICLE {n}>>>"
+        for n, (_, text) in enumerate(batch, 1)
+    )
+    prompt = f"""{SUMMARY_INSTRUCTIONS}
+{BATCH_INSTRUCTIONS.format(count=len(batch))}
+{articles}
+"""
+
     try:
-        chat = client.chat.completions.create(
-            model="groq/compound-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3,
-            max_tokens=1000,
-        )
-        
-        summary = chat.choices[0].message.content.strip()
-        return summary if summary else "Summary not available - no response generated."
-        
+        content = llm.complete(prompt, GROQ_MODEL, SUMMARY_TEMPERATURE, max_tokens=min(350 * len(batch), 8000))
     except Exception as e:
-        print(f"   ⚠️ Summarization error: {e}")
-        return f"Summary not available - API error: {str(e)}"
\ No newline at end of file
+        metrics.count("summary.batch_errors")
+        log(f"   ⚠️ Batch summarization error: {e}")
+        return {}
+
+    sections = parse_batch_response(content, len(batch))
+    return {batch[n - 1][0]: summary for n, summary in sections.items()}
+
+
+def summarize_batch(texts: list, workers: int = 1) -> list:
+    """
+    Summarize many articles with as few requests as possible.
+    Short articles are packed into shared requests (up to SUMMARY_BATCH_TOKEN_BUDGET each);
+    long articles, and any article whose batched summary could not be parsed, get a request of their own.
+    Returns summaries in the same order as texts.
+    """
+    summaries = [None] * len(texts)
+    short = []
+    single = []
+
+    for i, text in enumerate(texts):
+        if not text or not text.strip():
+            summaries[i] = "Summary not available - article text could not be extracted."
+            continue
+        prepared = prepare_text(text)
+        cached = cached_summary(prepared)
+        if cached:
+            summaries[i] = cached
+        elif len(prepared) <= SUMMARY_BATCH_ARTICLE_MAX_CHARS:
+            short.append((i, prepared))
+        else:
+            single.append((i, prepared))
+
+    batches = pack_batches(short, SUMMARY_BATCH_TOKEN_BUDGET, SUMMARY_BATCH_MAX_ARTICLES)
+    if batches:
+        log(f"   📦 Summarizing {len(short)} short articles in {len(batches)} batched requests")
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        for batch, results in zip(batches, pool.map(summarize_one_batch, batches)):
+            for index, prepared in batch:
+                summary = results.get(index)
+                if summary:
+                    summaries[index] = summary
+                    store_summary(prepared, summary)
+                else:
+                    single.append((index, prepared))
+
+        # Long articles and unparsed batch entries fall back to one request each
+        for (index, _), summary in zip(single, pool.map(summarize_prepared, [p for _, p in single])):
+            summaries[index] = summary
+
+    return summaries
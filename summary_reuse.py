@@ -0,0 +1,108 @@
+import re
+import threading
+from concurrent.futures import Future
+
+from config import BODY_SIMHASH_DISTANCE, BODY_MIN_WORDS
+from dedupe import simhash, SimHashIndex
+from metrics import metrics, log
+
+
+def done_future(value) -> Future:
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def chain_future(source: Future, target: Future):
+    """Resolve target with source's result (or exception) once source is done"""
+    def copy(future):
+        if future.exception() is not None:
+            target.set_exception(future.exception())
+        else:
+            target.set_result(future.result())
+    source.add_done_callback(copy)
+
+
+class SummaryReuse:
+    """
+    One summary per story, however many outlets ran it.
+
+    Fetched bodies are SimHash-fingerprinted before summarizing. A body within
+    BODY_SIMHASH_DISTANCE bits of one already summarized in this run shares that
+    article's summary future; one within range of an article stored by an earlier
+    run (state store) takes its stored summary. Either way no LLM call is made, and
+    same_as[i] records the link of the article the summary came from. If the shared
+    summary fails, the copy is summarized on its own instead.
+    """
+
+    def __init__(self, previous: list = (), max_distance: int = BODY_SIMHASH_DISTANCE,
+                 min_words: int = BODY_MIN_WORDS):
+        self.min_words = min_words
+        self.index = SimHashIndex(max_distance)
+        self._lock = threading.Lock()
+        self.fingerprints = {}  # result index -> body SimHash
+        self.same_as = {}       # result index -> link whose summary was reused
+        self.reused_run = 0
+        self.reused_previous = 0
+        for fingerprint, row in previous:
+            self.index.add(fingerprint, (row["link"], None, row["summary"]))
+
+    def summary_future(self, i: int, link: str, text: str, submit, retry=None) -> Future:
+        """
+        Future of (summary, ok) for results[i]. submit(text) starts a real summary and
+        returns its future; it is only called for bodies not seen before. retry(text)
+        (default: submit) summarizes a copy whose original's summary failed.
+        """
+        if not text or len(re.findall(r"\w+", text)) < self.min_words:
+            return submit(text)
+
+        fingerprint = simhash(text)
+        with self._lock:
+            self.fingerprints[i] = fingerprint
+            match = self.index.find(fingerprint)
+            if match is None:
+                future = submit(text)
+                self.index.add(fingerprint, (link, future, None))
+                return future
+
+            source, future, summary = match
+            self.same_as[i] = source
+            if future is None:
+                self.reused_previous += 1
+                metrics.count("dedupe.body_reused_previous")
+        if future is None:
+            log(f"   🧬 Same story as {source[:70]} - reusing its summary")
+            return done_future((summary, True))
+        return self._share(i, source, future, text, retry or submit)
+
+    def _share(self, i: int, source: str, original: Future, text: str, retry) -> Future:
+        """The original's (summary, ok) once it succeeds; a summary of this copy if it failed"""
+        shared = Future()
+
+        def resolve(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = (f"Summary not available - API error: {str(e)}", False)
+            if result[1]:
+                with self._lock:
+                    self.reused_run += 1
+                metrics.count("dedupe.body_reused_run")
+                log(f"   🧬 Same story as {source[:70]} - reusing its summary")
+                shared.set_result(result)
+                return
+            # Don't spread one failed request to every syndicated copy
+            with self._lock:
+                self.same_as.pop(i, None)
+            metrics.count("dedupe.body_reuse_failed")
+            log(f"   🧬 Summary of {source[:70]} failed - summarizing this copy on its own")
+            chain_future(retry(text), shared)
+
+        original.add_done_callback(resolve)
+        return shared
+
+    def print_report(self):
+        reused = self.reused_run + self.reused_previous
+        if reused:
+            print(f"🧬 Near-duplicate bodies: {reused} articles reused a summary "
+                  f"({self.reused_run} from this run, {self.reused_previous} from earlier runs)")
@@ -0,0 +1,51 @@
+from checkpoint import Checkpoint
+
+
+def record(n: int) -> dict:
+    return {"Title": f"Story {n}", "Summary": f"Summary {n}", "Link": f"https://example.com/{n}", "Date": ""}
+
+
+def test_resume_after_torn_last_line(tmp_path):
+    path = str(tmp_path / "run_checkpoint.jsonl")
+    results = [{"title": f"Story {n}", "link": f"https://example.com/{n}"} for n in range(5)]
+
+    checkpoint = Checkpoint(path)
+    checkpoint.start(results, skip=[4])
+    checkpoint.append(0, record(0))
+    checkpoint.append(2, record(2))
+    checkpoint.close()
+
+    # Simulate a crash in the middle of writing the next record
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "rec')
+
+    checkpoint = Checkpoint(path)
+    loaded_results, records, skip = checkpoint.resume()
+    assert loaded_results == results
+    assert records == {0: record(0), 2: record(2)}
+    assert skip == {4}
+
+    checkpoint.append(3, record(3))
+    checkpoint.close()
+
+    # The record written after resuming must survive the next resume
+    _, records, skip = Checkpoint.load(path)
+    assert records == {0: record(0), 2: record(2), 3: record(3)}
+    assert skip == {4}
+    with open(path, encoding="utf-8") as f:
+        assert all(line.startswith('{"type": ') for line in f)
+
+
+def test_resume_complete_file_keeps_every_line(tmp_path):
+    path = str(tmp_path / "run_checkpoint.jsonl")
+    checkpoint = Checkpoint(path)
+    checkpoint.start([{"title": "a", "link": "https://example.com/a"}])
+    checkpoint.append(0, record(0))
+    checkpoint.close()
+    size = len(open(path, "rb").read())
+
+    checkpoint = Checkpoint(path)
+    _, records, _ = checkpoint.resume()
+    checkpoint.close()
+    assert records == {0: record(0)}
+    assert len(open(path, "rb").read()) == size
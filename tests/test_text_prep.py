@@ -0,0 +1,37 @@
+from text_prep import prepare_for_summary
+
+
+def paragraphs(prepared) -> list:
+    return prepared.text.split("\n\n")
+
+
+def test_article_sentences_mentioning_furniture_phrases_are_kept():
+    article = "\n\n".join([
+        "Medibank has updated its privacy policy after the 2022 data breach exposed records of 9.7 million Australians.",
+        "Patients who sign up to the new My Health Record app will be able to see pathology results within days.",
+        "The insurer said customers who subscribe to its extras cover would be contacted directly.",
+        "Shoppers can still refuse tracking cookies online, the regulator said.",
+        "Read more",
+        "Sign up for our daily newsletter",
+        "© 2026 Example News. All rights reserved.",
+    ])
+    kept = paragraphs(prepare_for_summary(article, 2000))
+    assert kept == [
+        "Medibank has updated its privacy policy after the 2022 data breach exposed records of 9.7 million Australians.",
+        "Patients who sign up to the new My Health Record app will be able to see pathology results within days.",
+        "The insurer said customers who subscribe to its extras cover would be contacted directly.",
+        "Shoppers can still refuse tracking cookies online, the regulator said.",
+    ]
+
+
+def test_short_lead_is_never_dropped():
+    article = "\n\n".join([
+        "Cookie makers brace for cocoa price rise",
+        "Biscuit manufacturers warned of higher shelf prices as cocoa futures hit a record.",
+        "Advertisement",
+    ])
+    kept = paragraphs(prepare_for_summary(article, 2000))
+    assert kept == [
+        "Cookie makers brace for cocoa price rise",
+        "Biscuit manufacturers warned of higher shelf prices as cocoa futures hit a record.",
+    ]
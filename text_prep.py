@@ -0,0 +1,154 @@
+import math
+import re
+import threading
+from collections import Counter, namedtuple
+
+# Page furniture: a short paragraph that starts or ends with one of these phrases
+_FURNITURE = (
+    r"(?:cookies?|privacy policy|terms of (?:use|service)|all rights reserved"
+    r"|read more|continue reading|click here|sign up|subscribe|newsletters?|advertisement"
+    r"|follow us|share (?:this|on)|related (?:articles|stories|coverage)|recommended for you"
+    r"|download (?:our|the) app|javascript|your browser|log ?in to|create an account)"
+)
+BOILERPLATE = re.compile(rf"^\W*(?:©|{_FURNITURE}\b)|\b{_FURNITURE}\W*$", re.IGNORECASE)
+BOILERPLATE_MAX_CHARS = 80
+
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[\"'‘“(\[]?[A-Z0-9])")
+WORD = re.compile(r"[a-z][a-z'-]{3,}")
+NUMBER = re.compile(r"\d[\d,.%]*")
+
+STOPWORDS = frozenset("""
+about above after again against also among around because been before being below between both
+could does doing down during each from further have having here into just more most much must
+only other over same says said should some such than that their them then there these they this
+those through under until very were what when where which while will with would your year years
+""".split())
+
+Prepared = namedtuple("Prepared", ["text", "tokens_in", "tokens_out"])
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token for English prose)"""
+    return len(text) // 4 + 1
+
+
+def split_units(text: str, max_tokens: int) -> list:
+    """Paragraphs, with any paragraph larger than max_tokens split into sentences"""
+    units = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = " ".join(paragraph.split())
+        if not paragraph:
+            continue
+        if estimate_tokens(paragraph) > max_tokens:
+            units.extend(s for s in SENTENCE_END.split(paragraph) if s)
+        else:
+            units.append(paragraph)
+    return units
+
+
+def remove_boilerplate(units: list) -> list:
+    """
+    Drop short boilerplate paragraphs and repeats of an earlier paragraph. The first
+    paragraph is the lead and is always kept.
+    """
+    kept = []
+    seen = set()
+    for position, unit in enumerate(units):
+        key = re.sub(r"\W+", "", unit.lower())
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        if position and len(unit) < BOILERPLATE_MAX_CHARS and BOILERPLATE.search(unit):
+            continue
+        kept.append(unit)
+    return kept
+
+
+def score_units(units: list) -> list:
+    """
+    Information score per paragraph: how many of the article's frequent content words it
+    covers per word, boosted for the lead, the closing paragraph and concrete figures.
+    """
+    words = [WORD.findall(unit.lower()) for unit in units]
+    frequency = Counter(w for unit_words in words for w in unit_words if w not in STOPWORDS)
+
+    scores = []
+    last = len(units) - 1
+    for position, (unit, unit_words) in enumerate(zip(units, words)):
+        terms = {w for w in unit_words if w not in STOPWORDS}
+        score = sum(math.log1p(frequency[w]) for w in terms) / math.sqrt(len(unit_words) + 1)
+        score *= 1 + 0.1 * min(len(NUMBER.findall(unit)), 5)
+        if position == 0:
+            score *= 1.6
+        elif position == 1:
+            score *= 1.3
+        elif position == last:
+            score *= 1.2
+        scores.append(score)
+    return scores
+
+
+def select_units(units: list, token_budget: int) -> list:
+    """Highest-scoring paragraphs that fit token_budget, returned in original order"""
+    costs = [estimate_tokens(unit) + 1 for unit in units]
+    if sum(costs) <= token_budget:
+        return units
+
+    scores = score_units(units)
+    chosen = set()
+    used = 0
+    for i in sorted(range(len(units)), key=lambda i: -scores[i]):
+        if used + costs[i] <= token_budget:
+            chosen.add(i)
+            used += costs[i]
+    if not chosen:
+        # One enormous run-on paragraph: fall back to its opening words
+        return [units[0][:token_budget * 4].rsplit(" ", 1)[0] + "..."]
+    return [unit for i, unit in enumerate(units) if i in chosen]
+
+
+class TokenSavings:
+    """Run totals of estimated summarizer input tokens before and after preparation"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.articles = 0
+        self.tokens_in = 0
+        self.tokens_out = 0
+        self.tokens_fixed_cut = 0
+
+    def record(self, raw: str, prepared: Prepared, fixed_cut_chars: int = 8000):
+        with self._lock:
+            self.articles += 1
+            self.tokens_in += prepared.tokens_in
+            self.tokens_out += prepared.tokens_out
+            self.tokens_fixed_cut += estimate_tokens(raw[:fixed_cut_chars])
+
+    def stats(self) -> dict:
+        with self._lock:
+            saved = self.tokens_fixed_cut - self.tokens_out
+            return {
+                "articles": self.articles,
+                "tokens_in": self.tokens_in,
+                "tokens_out": self.tokens_out,
+                "saved_vs_fixed_cut": saved,
+                "saved_rate": saved / self.tokens_fixed_cut if self.tokens_fixed_cut else 0.0,
+            }
+
+
+token_savings = TokenSavings()
+
+
+def prepare_for_summary(text: str, token_budget: int) -> Prepared:
+    """
+    Shrink article text to at most ~token_budget tokens without cutting mid-sentence:
+    boilerplate and repeated paragraphs are dropped, then the most informative paragraphs
+    are kept in their original order.
+    """
+    tokens_in = estimate_tokens(text)
+    units = split_units(text, token_budget // 2)
+    units = remove_boilerplate(units) or units
+    prepared = "\n\n".join(select_units(units, token_budget))
+    result = Prepared(prepared, tokens_in, estimate_tokens(prepared) if prepared else 0)
+    token_savings.record(text, result)
+    return result